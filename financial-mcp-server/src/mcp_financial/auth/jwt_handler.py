@@ -4,8 +4,8 @@ JWT authentication handler compatible with existing financial services.
 
 import jwt
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Collection, Callable
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -16,8 +16,8 @@ class UserContext:
     """User context extracted from JWT token."""
     user_id: str
     username: str
-    roles: List[str]
-    permissions: List[str]
+    roles: Collection[str]
+    permissions: Collection[str]
     
     def has_role(self, role: str) -> bool:
         """Check if user has specific role."""
@@ -41,9 +41,15 @@ class AuthorizationError(Exception):
 class JWTAuthHandler:
     """JWT authentication handler."""
     
-    def __init__(self, secret_key: str, algorithm: str = "HS256"):
+    def __init__(self, secret_key: str, algorithm: str = "HS256", time_source: Callable[[], float] = time.time):
         self.secret_key = secret_key
         self.algorithm = algorithm
+        # Clock used for iat/exp; tests inject a fake to expire tokens without sleeping
+        self._now = time_source
+        # Build the decode arguments once instead of on every call
+        self._algorithms = [algorithm]
+        # Disable iat verification for testing; exp is checked in validate_token against self._now
+        self._decode_options = {"verify_iat": False, "verify_exp": False}
         
     def validate_token(self, token: str) -> Dict[str, Any]:
         """
@@ -66,14 +72,14 @@ class JWTAuthHandler:
             payload = jwt.decode(
                 token, 
                 self.secret_key, 
-                algorithms=[self.algorithm],
-                options={"verify_iat": False}  # Disable iat verification for testing
+                algorithms=self._algorithms,
+                options=self._decode_options
             )
             
             # Validate token expiration
             if 'exp' in payload:
                 exp_timestamp = payload['exp']
-                if datetime.utcnow().timestamp() > exp_timestamp:
+                if self._now() > exp_timestamp:
                     raise AuthenticationError("Token has expired")
                     
             logger.debug(f"Token validated for user: {payload.get('sub', 'unknown')}")
@@ -113,7 +119,7 @@ class JWTAuthHandler:
         roles = claims.get('roles', [])
         permissions = claims.get('permissions', [])
         
-        # Ensure roles and permissions are lists
+        # Claims are lists on the wire; hold them as frozensets for O(1) membership checks
         if isinstance(roles, str):
             roles = [roles]
         if isinstance(permissions, str):
@@ -122,8 +128,8 @@ class JWTAuthHandler:
         return UserContext(
             user_id=user_id,
             username=username,
-            roles=roles,
-            permissions=permissions
+            roles=frozenset(roles),
+            permissions=frozenset(permissions)
         )
         
     def create_token(
@@ -147,14 +153,14 @@ class JWTAuthHandler:
         Returns:
             JWT token string
         """
-        now = datetime.utcnow()
+        now = self._now()
         payload = {
             'sub': user_id,
             'username': username,
             'roles': roles or [],
             'permissions': permissions or [],
-            'iat': int(now.timestamp()) - 1,  # Subtract 1 second to avoid timing issues
-            'exp': int((now + timedelta(seconds=expires_in)).timestamp())
+            'iat': int(now) - 1,  # Subtract 1 second to avoid timing issues
+            'exp': int(now + expires_in)
         }
         
         return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
\ No newline at end of file
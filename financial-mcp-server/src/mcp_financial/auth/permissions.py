@@ -3,7 +3,7 @@ Role-based access control and permissions management.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, FrozenSet
 from enum import Enum
 
 from .jwt_handler import UserContext
@@ -143,6 +143,15 @@ ROLE_PERMISSIONS: Dict[Role, List[Permission]] = {
 }
 
 
+# Frozen view of ROLE_PERMISSIONS built once at import, so role checks are set lookups.
+# Admin and internal service hold every permission (the bypass in has_permission).
+_ROLE_PERMISSION_SETS: Dict[Role, FrozenSet[Permission]] = {
+    role: frozenset(Permission) if role in (Role.ADMIN, Role.INTERNAL_SERVICE)
+    else frozenset(ROLE_PERMISSIONS.get(role, ()))
+    for role in Role
+}
+
+
 class PermissionChecker:
     """Permission checking utility."""
 
@@ -179,19 +188,10 @@ class PermissionChecker:
         if permission.value in user_context.permissions:
             return True
 
-        resolved_roles = []
+        # Check role-based permissions (admin/internal service hold all of them)
         for role_str in user_context.roles:
             role = PermissionChecker._resolve_role(role_str)
-            if role:
-                resolved_roles.append(role)
-
-        # Admin/internal service bypass
-        if Role.ADMIN in resolved_roles or Role.INTERNAL_SERVICE in resolved_roles:
-            return True
-
-        # Check role-based permissions
-        for role in resolved_roles:
-            if permission in ROLE_PERMISSIONS.get(role, []):
+            if role and permission in _ROLE_PERMISSION_SETS[role]:
                 return True
 
         return False
@@ -4,10 +4,15 @@ Base HTTP client with common functionality including retry logic and circuit bre
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, Union
+import time
+from enum import Enum, IntEnum
+from functools import partial
+from typing import Dict, Any, Optional, Union, Callable, Awaitable, Tuple, Type
 from datetime import datetime, timedelta
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import AsyncRetrying, RetryCallState, stop_after_attempt, wait_exponential, retry_if_exception
+
+from ..exceptions.base import MCPFinancialError, ServiceError, TimeoutError as RequestTimeoutError
 
 logger = logging.getLogger(__name__)
 
@@ -22,91 +27,199 @@ class ServiceUnavailableError(Exception):
     pass
 
 
+# Methods that may be re-sent after the service could already have acted on them
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _is_retryable_error(method: str, error: BaseException) -> bool:
+    """Whether a failed request attempt may be re-sent.
+    
+    A connection failure or connect timeout never reached the service, so any
+    method is retried. Any other timeout is retried only for idempotent methods:
+    the service may already have applied a timed-out POST, such as a deposit.
+    """
+    if not isinstance(error, (ServiceError, RequestTimeoutError)):
+        return False
+    if isinstance(error.__cause__, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return True
+    return isinstance(error, RequestTimeoutError) and method in _IDEMPOTENT_METHODS
+
+
+class BreakerState(IntEnum):
+    """Circuit breaker states."""
+    
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
+class BreakerEvent(Enum):
+    """Events that drive circuit breaker state transitions."""
+    
+    FAILURE = "failure"
+    FAILURE_THRESHOLD = "failure_threshold"
+    RECOVERY_TIMEOUT = "recovery_timeout"
+    SUCCESS_THRESHOLD = "success_threshold"
+
+
+# (state, event) -> next state; pairs not listed leave the state unchanged
+_TRANSITIONS: Dict[Tuple[BreakerState, BreakerEvent], BreakerState] = {
+    (BreakerState.CLOSED, BreakerEvent.FAILURE_THRESHOLD): BreakerState.OPEN,
+    (BreakerState.OPEN, BreakerEvent.RECOVERY_TIMEOUT): BreakerState.HALF_OPEN,
+    (BreakerState.HALF_OPEN, BreakerEvent.FAILURE): BreakerState.OPEN,
+    (BreakerState.HALF_OPEN, BreakerEvent.FAILURE_THRESHOLD): BreakerState.OPEN,
+    (BreakerState.HALF_OPEN, BreakerEvent.SUCCESS_THRESHOLD): BreakerState.CLOSED,
+}
+
+
 class CircuitBreaker:
     """Enhanced circuit breaker implementation with better error handling."""
     
-    def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 30, half_open_max_calls: int = 3):
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: int = 30,
+        half_open_max_calls: int = 3,
+        time_source: Callable[[], int] = time.monotonic_ns,
+        failure_exceptions: Tuple[Type[BaseException], ...] = (Exception,)
+    ):
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.half_open_max_calls = half_open_max_calls
         self.failure_count = 0
-        self.last_failure_time: Optional[datetime] = None
-        self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        # Monotonic clock reading (ns) of the last failure; cheaper than datetime on the request path
+        self.last_failure_time: Optional[int] = None
+        self.state = BreakerState.CLOSED
         self.half_open_calls = 0
         self.consecutive_successes = 0
+        # Monotonic ns clock; tests inject a fake to pass the recovery timeout without sleeping
+        self._now = time_source
+        # Only these exceptions count as failures; any other error propagates without touching the state
+        self.failure_exceptions = failure_exceptions
         
     def call(self, func):
-        """Decorator for circuit breaker functionality."""
+        """Decorator for circuit breaker functionality (kept for compatibility; prefer execute)."""
         def wrapper(*args, **kwargs):
-            if self.state == "OPEN":
-                if self._should_attempt_reset():
-                    self.state = "HALF_OPEN"
-                    self.half_open_calls = 0
-                    logger.info("Circuit breaker transitioning to HALF_OPEN")
-                else:
-                    raise CircuitBreakerError("Circuit breaker is OPEN")
-                    
-            if self.state == "HALF_OPEN":
-                if self.half_open_calls >= self.half_open_max_calls:
-                    raise CircuitBreakerError("Circuit breaker HALF_OPEN call limit exceeded")
-                self.half_open_calls += 1
-                    
-            try:
-                result = func(*args, **kwargs)
-                self._on_success()
-                return result
-            except Exception as e:
-                self._on_failure(e)
-                raise
-                
+            return self.execute(func, *args, **kwargs)
         return wrapper
         
+    def execute(self, func, *args, **kwargs):
+        """Invoke func through the circuit breaker without wrapping it."""
+        self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except self.failure_exceptions as e:
+            self._on_failure(e)
+            raise
+        except BaseException:
+            self._on_ignored_error()
+            raise
+        self._on_success()
+        return result
+        
+    async def execute_async(self, func, *args, **kwargs):
+        """Await func(*args, **kwargs) through the circuit breaker."""
+        self._before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except self.failure_exceptions as e:
+            self._on_failure(e)
+            raise
+        except BaseException:
+            self._on_ignored_error()
+            raise
+        self._on_success()
+        return result
+        
+    def _before_call(self):
+        """Reject the call if the circuit is open, or admit it as a half-open probe."""
+        # State lives in plain attributes: on a single event loop no lock is needed,
+        # and the common CLOSED case returns after one comparison.
+        if self.state == BreakerState.CLOSED:
+            return
+            
+        if self.state == BreakerState.OPEN:
+            if not self._should_attempt_reset():
+                raise CircuitBreakerError("Circuit breaker is OPEN")
+            self._transition(BreakerEvent.RECOVERY_TIMEOUT)
+            self.half_open_calls = 0
+            logger.info("Circuit breaker transitioning to HALF_OPEN")
+                
+        if self.state == BreakerState.HALF_OPEN:
+            if self.half_open_calls >= self.half_open_max_calls:
+                raise CircuitBreakerError("Circuit breaker HALF_OPEN call limit exceeded")
+            self.half_open_calls += 1
+        
+    def _transition(self, event: BreakerEvent) -> BreakerState:
+        """Move to the state the transition table gives for event; return the previous state."""
+        previous = self.state
+        self.state = _TRANSITIONS.get((previous, event), previous)
+        return previous
+        
     def _should_attempt_reset(self) -> bool:
         """Check if circuit breaker should attempt reset."""
         if self.last_failure_time is None:
             return True
-        return datetime.utcnow() - self.last_failure_time > timedelta(seconds=self.recovery_timeout)
+        return self._now() - self.last_failure_time > self.recovery_timeout * 1_000_000_000
         
     def _on_success(self):
         """Handle successful call."""
         self.consecutive_successes += 1
         
-        if self.state == "HALF_OPEN":
+        if self.state == BreakerState.HALF_OPEN:
             if self.consecutive_successes >= 3:  # Require multiple successes to close
-                self.state = "CLOSED"
+                self._transition(BreakerEvent.SUCCESS_THRESHOLD)
                 self.failure_count = 0
                 self.consecutive_successes = 0
                 logger.info("Circuit breaker reset to CLOSED after successful calls")
-        elif self.state == "CLOSED":
+        elif self.state == BreakerState.CLOSED:
             # Reset failure count on successful calls
             if self.failure_count > 0:
                 self.failure_count = max(0, self.failure_count - 1)
             
+    def _on_ignored_error(self):
+        """Handle an error that is not a counted failure: give back its half-open probe slot."""
+        if self.state == BreakerState.HALF_OPEN and self.half_open_calls > 0:
+            self.half_open_calls -= 1
+            
     def _on_failure(self, exception: Exception):
         """Handle failed call with exception context."""
         self.failure_count += 1
-        self.last_failure_time = datetime.utcnow()
+        self.last_failure_time = self._now()
         self.consecutive_successes = 0
         
         # Log failure details
-        logger.warning(f"Circuit breaker failure #{self.failure_count}: {str(exception)}")
+        logger.warning("Circuit breaker failure #%d: %s", self.failure_count, exception)
         
-        if self.state == "HALF_OPEN":
-            # Immediately open on any failure in half-open state
-            self.state = "OPEN"
+        # Any failure in HALF_OPEN reopens the circuit; CLOSED opens only at the threshold
+        event = BreakerEvent.FAILURE_THRESHOLD if self.failure_count >= self.failure_threshold else BreakerEvent.FAILURE
+        previous = self._transition(event)
+        if previous == BreakerState.HALF_OPEN:
             logger.warning("Circuit breaker opened from HALF_OPEN due to failure")
-        elif self.failure_count >= self.failure_threshold:
-            self.state = "OPEN"
-            logger.error(f"Circuit breaker opened after {self.failure_count} failures")
+        elif event == BreakerEvent.FAILURE_THRESHOLD:
+            logger.error("Circuit breaker opened after %d failures", self.failure_count)
             
+    def reset(self):
+        """Return the circuit breaker to a fresh CLOSED state."""
+        self.state = BreakerState.CLOSED
+        self.failure_count = 0
+        self.last_failure_time = None
+        self.half_open_calls = 0
+        self.consecutive_successes = 0
+        
     def get_state(self) -> Dict[str, Any]:
         """Get current circuit breaker state information."""
+        last_failure_time = None
+        if self.last_failure_time is not None:
+            # Translate the monotonic reading back to wall-clock time for reporting
+            elapsed_ns = self._now() - self.last_failure_time
+            last_failure_time = (datetime.utcnow() - timedelta(microseconds=elapsed_ns // 1000)).isoformat()
         return {
-            "state": self.state,
+            "state": self.state.name,
             "failure_count": self.failure_count,
             "consecutive_successes": self.consecutive_successes,
-            "last_failure_time": self.last_failure_time.isoformat() if self.last_failure_time else None,
-            "half_open_calls": self.half_open_calls if self.state == "HALF_OPEN" else 0
+            "last_failure_time": last_failure_time,
+            "half_open_calls": self.half_open_calls if self.state == BreakerState.HALF_OPEN else 0
         }
 
 
@@ -120,23 +233,33 @@ class BaseHTTPClient:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         circuit_breaker_failure_threshold: int = 5,
-        circuit_breaker_recovery_timeout: int = 30
+        circuit_breaker_recovery_timeout: int = 30,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        time_source: Callable[[], int] = time.monotonic_ns
     ):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout / 1000  # Convert to seconds
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        # Backoff sleep between retries; tests inject a no-op to skip the real delay
+        self._sleep = sleep
         
-        # Initialize HTTP client
+        # Initialize HTTP client (a custom transport is mainly used to mock services in tests)
         self.client = httpx.AsyncClient(
             timeout=httpx.Timeout(self.timeout),
-            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            transport=transport
         )
         
-        # Initialize circuit breaker
+        # Initialize circuit breaker; only an unreachable or failing service (connection,
+        # timeout, 5xx) trips it, client errors such as 400/404 are the caller's problem.
+        # Its recovery timeout runs on time_source, which tests replace with a fake clock.
         self.circuit_breaker = CircuitBreaker(
             failure_threshold=circuit_breaker_failure_threshold,
-            recovery_timeout=circuit_breaker_recovery_timeout
+            recovery_timeout=circuit_breaker_recovery_timeout,
+            time_source=time_source,
+            failure_exceptions=(ServiceError, RequestTimeoutError)
         )
         
     async def __aenter__(self):
@@ -164,11 +287,6 @@ class BaseHTTPClient:
             
         return headers
         
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.ConnectError))
-    )
     async def _make_request(
         self,
         method: str,
@@ -191,16 +309,16 @@ class BaseHTTPClient:
             Response data as dictionary
             
         Raises:
-            ServiceUnavailableError: If service is unavailable
+            ServiceError: For connection errors and 5xx responses
+            TimeoutError: If the request times out
             CircuitBreakerError: If circuit breaker is open
-            httpx.HTTPStatusError: For HTTP errors
+            MCPFinancialError: The matching subclass for 4xx responses
         """
         url = f"{self.base_url}{endpoint}"
         headers = self._get_headers(auth_token)
         
         logger.debug(f"Making {method} request to {url}")
         
-        @self.circuit_breaker.call
         async def make_request():
             try:
                 response = await self.client.request(
@@ -283,7 +401,7 @@ class BaseHTTPClient:
                     timeout_seconds=self.timeout,
                     operation=f"{method} {endpoint}",
                     details={"url": url, "timeout": self.timeout}
-                )
+                ) from e
             except httpx.ConnectError as e:
                 logger.warning(f"Connection error for {url}: {str(e)}")
                 from ..exceptions.base import ServiceError
@@ -291,7 +409,7 @@ class BaseHTTPClient:
                     message=f"Connection error: {url}",
                     service_name=self._extract_service_name(url),
                     details={"url": url, "error": str(e)}
-                )
+                ) from e
             except httpx.HTTPStatusError as e:
                 # This should be handled above, but just in case
                 logger.warning(f"HTTP error {e.response.status_code} for {url}: {str(e)}")
@@ -302,6 +420,9 @@ class BaseHTTPClient:
                     status_code=e.response.status_code,
                     details={"url": url, "error": str(e)}
                 )
+            except MCPFinancialError:
+                # Errors mapped from the response status above propagate unchanged
+                raise
             except Exception as e:
                 logger.error(f"Unexpected error for {url}: {str(e)}", exc_info=True)
                 from ..exceptions.base import ServiceError
@@ -311,7 +432,20 @@ class BaseHTTPClient:
                     details={"url": url, "error": str(e), "type": type(e).__name__}
                 )
                 
-        return await make_request()
+        # make_request has already mapped httpx errors to MCP errors, so retry on those;
+        # stop early once the breaker opens and re-raise the last error rather than RetryError
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries + 1) | self._circuit_open,
+            wait=wait_exponential(multiplier=self.retry_delay, min=self.retry_delay, max=10),
+            retry=retry_if_exception(partial(_is_retryable_error, method.upper())),
+            sleep=self._sleep,
+            reraise=True
+        )
+        return await retrying(self.circuit_breaker.execute_async, make_request)
+        
+    def _circuit_open(self, retry_state: RetryCallState) -> bool:
+        """Retry stop condition: no further attempts once the circuit breaker is open."""
+        return self.circuit_breaker.state == BreakerState.OPEN
         
     async def get(
         self, 
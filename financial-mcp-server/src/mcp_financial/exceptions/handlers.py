@@ -195,6 +195,10 @@ class ErrorHandler:
             logger.info("Low severity error occurred", extra=log_data)
 
 
+# ErrorHandler holds no per-call state, so the module helpers share one instance
+_error_handler = ErrorHandler()
+
+
 class ValidationErrorCollector:
     """Utility for collecting and managing validation errors."""
     
@@ -260,12 +264,10 @@ def error_handling_context(
         additional_context=additional_context
     )
     
-    error_handler = ErrorHandler()
-    
     try:
         yield context
     except Exception as e:
-        error_response = error_handler.handle_error(e, context, include_traceback)
+        error_response = _error_handler.handle_error(e, context, include_traceback)
         # Re-raise as MCPFinancialError with structured response
         raise MCPFinancialError(
             message=error_response.error_message,
@@ -299,8 +301,7 @@ def create_error_response(
         request_id=request_id
     )
     
-    error_handler = ErrorHandler()
-    error_response = error_handler.handle_error(error, context)
+    error_response = _error_handler.handle_error(error, context)
     
     return [TextContent(type="text", text=error_response.model_dump_json())]
 
@@ -6,6 +6,7 @@ import logging
 from typing import Dict, List, Optional, Any, Set
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from pydantic import BaseModel
 from mcp.types import (
     InitializeRequest, InitializeResult,
     ListToolsRequest, ListToolsResult,
@@ -60,7 +61,7 @@ class ProtocolCompliance:
                 code="MISSING_CAPABILITIES",
                 message="Initialize request must include capabilities"
             ))
-        elif not isinstance(request.capabilities, dict):
+        elif not isinstance(request.capabilities, (dict, BaseModel)):
             issues.append(ComplianceIssue(
                 severity="error",
                 code="INVALID_CAPABILITIES_TYPE",
@@ -118,7 +119,7 @@ class ProtocolCompliance:
                 code="MISSING_RESULT_CAPABILITIES",
                 message="Initialize result must include capabilities"
             ))
-        elif not isinstance(result.capabilities, dict):
+        elif not isinstance(result.capabilities, (dict, BaseModel)):
             issues.append(ComplianceIssue(
                 severity="error",
                 code="INVALID_RESULT_CAPABILITIES_TYPE",
@@ -5,18 +5,39 @@ Protocol validation utilities for MCP compliance.
 import logging
 import json
 from typing import Dict, List, Optional, Any, Union
-from jsonschema import validate, ValidationError, Draft7Validator
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from mcp.types import Tool, TextContent
 
 logger = logging.getLogger(__name__)
 
 
+def _compile_validator(schema: Dict[str, Any]):
+    """Build a validator for a JSON schema, checking the schema itself once."""
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
 class ProtocolValidator:
     """Validates MCP protocol messages and data structures."""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self._initialize_schemas()
+        # (schema, compiled validator) keyed by schema name: the protocol schemas up
+        # front, tool input schemas on first use
+        self._validators = {
+            name: (schema, _compile_validator(schema))
+            for name, schema in (
+                ("initialize_request", self.initialize_request_schema),
+                ("initialize_result", self.initialize_result_schema),
+                ("tool", self.tool_schema),
+                ("call_tool_request", self.call_tool_request_schema),
+                ("call_tool_result", self.call_tool_result_schema),
+            )
+        }
         
     def _initialize_schemas(self) -> None:
         """Initialize JSON schemas for validation."""
@@ -109,30 +130,45 @@ class ProtocolValidator:
             }
         }
         
-    def validate_json_schema(self, data: Dict[str, Any], schema: Dict[str, Any]) -> List[str]:
-        """Validate data against JSON schema."""
+    def get_schema_validator(self, name: str, schema: Dict[str, Any]):
+        """Return the validator compiled for schema under name.
+        
+        The cached validator is reused only while name maps to the same schema
+        object; a tool re-registered with a new schema gets it recompiled.
+        """
+        cached = self._validators.get(name)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+        validator = _compile_validator(schema)
+        self._validators[name] = (schema, validator)
+        return validator
+        
+    def validate_json_schema(
+        self, data: Dict[str, Any], schema: Dict[str, Any], schema_name: Optional[str] = None
+    ) -> List[str]:
+        """Validate data against JSON schema (reusing the compiled validator when schema_name is given)."""
         errors = []
         
-        try:
-            validate(instance=data, schema=schema)
-        except ValidationError as e:
-            errors.append(f"Schema validation error: {e.message}")
-            if e.path:
-                errors.append(f"Error path: {' -> '.join(str(p) for p in e.path)}")
+        validator = self.get_schema_validator(schema_name, schema) if schema_name else _compile_validator(schema)
+        error = best_match(validator.iter_errors(data))
+        if error is not None:
+            errors.append(f"Schema validation error: {error.message}")
+            if error.path:
+                errors.append(f"Error path: {' -> '.join(str(p) for p in error.path)}")
                 
         return errors
         
     def validate_initialize_request(self, data: Dict[str, Any]) -> List[str]:
         """Validate MCP initialize request."""
-        return self.validate_json_schema(data, self.initialize_request_schema)
+        return self.validate_json_schema(data, self.initialize_request_schema, "initialize_request")
         
     def validate_initialize_result(self, data: Dict[str, Any]) -> List[str]:
         """Validate MCP initialize result."""
-        return self.validate_json_schema(data, self.initialize_result_schema)
+        return self.validate_json_schema(data, self.initialize_result_schema, "initialize_result")
         
     def validate_tool_definition(self, data: Dict[str, Any]) -> List[str]:
         """Validate MCP tool definition."""
-        errors = self.validate_json_schema(data, self.tool_schema)
+        errors = self.validate_json_schema(data, self.tool_schema, "tool")
         
         # Additional validation for tool names
         if 'name' in data:
@@ -187,11 +223,11 @@ class ProtocolValidator:
         
     def validate_call_tool_request(self, data: Dict[str, Any]) -> List[str]:
         """Validate MCP call tool request."""
-        return self.validate_json_schema(data, self.call_tool_request_schema)
+        return self.validate_json_schema(data, self.call_tool_request_schema, "call_tool_request")
         
     def validate_call_tool_result(self, data: Dict[str, Any]) -> List[str]:
         """Validate MCP call tool result."""
-        errors = self.validate_json_schema(data, self.call_tool_result_schema)
+        errors = self.validate_json_schema(data, self.call_tool_result_schema, "call_tool_result")
         
         # Additional validation for content items
         if 'content' in data and isinstance(data['content'], list):
@@ -231,16 +267,21 @@ class ProtocolValidator:
                 
         return errors
         
-    def validate_tool_arguments(self, arguments: Dict[str, Any], input_schema: Dict[str, Any]) -> List[str]:
-        """Validate tool arguments against input schema."""
+    def validate_tool_arguments(
+        self, arguments: Dict[str, Any], input_schema: Dict[str, Any], tool_name: Optional[str] = None
+    ) -> List[str]:
+        """Validate tool arguments against input schema (compiled once per tool_name when given)."""
         errors = []
         
-        try:
-            validate(instance=arguments, schema=input_schema)
-        except ValidationError as e:
-            errors.append(f"Argument validation error: {e.message}")
-            if e.path:
-                errors.append(f"Error path: {' -> '.join(str(p) for p in e.path)}")
+        if tool_name:
+            validator = self.get_schema_validator(f"tool_input:{tool_name}", input_schema)
+        else:
+            validator = _compile_validator(input_schema)
+        error = best_match(validator.iter_errors(arguments))
+        if error is not None:
+            errors.append(f"Argument validation error: {error.message}")
+            if error.path:
+                errors.append(f"Error path: {' -> '.join(str(p) for p in error.path)}")
                 
         return errors
         
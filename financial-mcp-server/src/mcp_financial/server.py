@@ -7,6 +7,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
 from mcp.server.models import InitializationOptions
 from mcp.types import Tool, TextContent, InitializeRequest, InitializeResult
 
@@ -37,16 +38,23 @@ class FinancialMCPServer:
         self.version_manager = VersionManager()
         self.protocol_compliance = ProtocolCompliance(self.version_manager)
         self.protocol_validator = ProtocolValidator()
+        # Route tool calls through _call_tool so arguments are checked against the
+        # tool's cached, compiled input schema before FastMCP runs the tool
+        self.app._mcp_server.call_tool(validate_input=False)(self._call_tool)
         
         # Initialize components
         self.auth_handler = JWTAuthHandler(self.settings.jwt_secret)
         self.account_client = AccountServiceClient(
             base_url=self.settings.account_service_url,
-            timeout=self.settings.http_timeout
+            timeout=self.settings.http_timeout,
+            max_retries=self.settings.max_retries,
+            retry_delay=self.settings.retry_delay
         )
         self.transaction_client = TransactionServiceClient(
             base_url=self.settings.transaction_service_url,
-            timeout=self.settings.http_timeout
+            timeout=self.settings.http_timeout,
+            max_retries=self.settings.max_retries,
+            retry_delay=self.settings.retry_delay
         )
         
         # Initialize plugin manager
@@ -125,6 +133,15 @@ class FinancialMCPServer:
         """Negotiate protocol version with client."""
         return self.version_manager.negotiate_version(client_version)
         
+    async def _call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """Validate tool call arguments against the tool's input schema, then run the tool."""
+        tool = self.app._tool_manager.get_tool(name)
+        if tool is not None:
+            errors = self.protocol_validator.validate_tool_arguments(arguments, tool.parameters, tool_name=name)
+            if errors:
+                raise ToolError(f"Invalid arguments for tool {name}: {'; '.join(errors)}")
+        return await self.app.call_tool(name, arguments)
+        
     def validate_protocol_compliance(self, request: InitializeRequest) -> InitializeResult:
         """Validate and create protocol-compliant initialize result."""
         # Validate request compliance
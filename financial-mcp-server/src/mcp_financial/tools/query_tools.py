@@ -13,7 +13,7 @@ from mcp.server.fastmcp import FastMCP
 from ..auth.jwt_handler import JWTAuthHandler
 from ..clients.account_client import AccountServiceClient
 from ..clients.transaction_client import TransactionServiceClient
-from ..utils.validation import validate_required_params, validate_date_format, validate_pagination_params
+from ..utils.validation import validate_required_params, validate_date_format, check_pagination_params
 from ..utils.metrics import query_tools_metrics
 
 logger = logging.getLogger(__name__)
@@ -97,7 +97,7 @@ class QueryTools:
                     return [TextContent(type="text", text=f"Validation error: {validation_error}")]
                 
                 # Validate pagination parameters
-                page_validation = validate_pagination_params(page, size, max_size=100)
+                page_validation = check_pagination_params(page, size, max_size=100)
                 if page_validation:
                     return [TextContent(type="text", text=f"Pagination error: {page_validation}")]
                 
@@ -202,7 +202,7 @@ class QueryTools:
                 user_context = self.auth_handler.extract_user_context(auth_token)
                 
                 # Validate pagination parameters
-                page_validation = validate_pagination_params(page, size, max_size=100)
+                page_validation = check_pagination_params(page, size, max_size=100)
                 if page_validation:
                     return [TextContent(type="text", text=f"Pagination error: {page_validation}")]
                 
@@ -273,7 +273,7 @@ def validate_date_format(date_string: str) -> bool:
         return False
 
 
-def validate_pagination_params(page: int, size: int, max_size: int = 100) -> Optional[str]:
+def check_pagination_params(page: int, size: int, max_size: int = 100) -> Optional[str]:
     """
     Validate pagination parameters.
     
@@ -4,13 +4,12 @@ Pytest configuration and shared fixtures for MCP Financial Server tests.
 
 import pytest
 import asyncio
-import sys
-import os
-from typing import Generator
 from unittest.mock import AsyncMock, MagicMock
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and not available on Windows
+    uvloop = None
 
 from mcp_financial.clients.account_client import AccountServiceClient
 from mcp_financial.clients.transaction_client import TransactionServiceClient
@@ -18,11 +17,9 @@ from mcp_financial.clients.base_client import BaseHTTPClient
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Event loop policy for every pytest-asyncio loop: uvloop when installed."""
+    return uvloop.EventLoopPolicy() if uvloop is not None else asyncio.DefaultEventLoopPolicy()
 
 
 @pytest.fixture
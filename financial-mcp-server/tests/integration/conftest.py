@@ -0,0 +1,88 @@
+"""
+Shared fixtures for the monitoring integration tests.
+"""
+
+import pytest
+import pytest_asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from mcp.server.fastmcp import FastMCP
+
+from mcp_financial.server import FinancialMCPServer
+from mcp_financial.tools import monitoring_tools as monitoring_tools_module
+from mcp_financial.tools.monitoring_tools import MonitoringTools
+from mcp_financial.utils import alerting
+from mcp_financial.utils.alerting import AlertManager
+from mcp_financial.utils.health import SystemHealthMonitor
+
+from tests.integration.monitoring_helpers import DEFAULT_USER_CONTEXT, FakeHealthChecker, FakeJWTAuthHandler
+
+
+# Real settings values for the monitoring server; nothing here is ever dialled
+MONITORING_SETTINGS = SimpleNamespace(
+    account_service_url="http://localhost:8080",
+    transaction_service_url="http://localhost:8081",
+    jwt_secret="test-secret",
+    http_timeout=5000,
+    max_retries=3,
+    retry_delay=1.0,
+    log_level="INFO",
+    log_format="json",
+    metrics_enabled=False,
+    metrics_port=9090
+)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def monitoring_server():
+    """Create server for monitoring testing with its tools registered, once per module, and close its clients."""
+    server = FinancialMCPServer(MONITORING_SETTINGS)
+    await server._register_tools()
+    yield server
+    
+    await server.account_client.close()
+    await server.transaction_client.close()
+    await server.health_checker.close()
+
+
+@pytest.fixture(scope="session")
+def app():
+    return FastMCP("Test MCP Server")
+
+
+@pytest.fixture(scope="session")
+def health_checker():
+    return FakeHealthChecker()
+
+
+@pytest.fixture(scope="session")
+def auth_handler():
+    return FakeJWTAuthHandler(DEFAULT_USER_CONTEXT)
+
+
+@pytest.fixture(scope="session")
+def monitoring_tools(app, health_checker, auth_handler):
+    return MonitoringTools(app, health_checker, auth_handler)
+
+
+@pytest.fixture
+def reset_monitoring_mocks(health_checker, auth_handler):
+    """Clear return values and side effects left on the shared mocks by earlier tests."""
+    health_checker.reset_mock()
+    auth_handler.reset_mock()
+
+
+@pytest.fixture
+def alert_manager():
+    """Swap a fresh AlertManager in for the process-wide one the alert helpers and tools share."""
+    manager = AlertManager()
+    with patch.object(alerting, "alert_manager", manager), \
+         patch.object(monitoring_tools_module, "alert_manager", manager):
+        yield manager
+
+
+@pytest.fixture
+def health_monitor(health_checker):
+    """Fresh SystemHealthMonitor over the shared fake health checker, with no history."""
+    return SystemHealthMonitor(health_checker)
@@ -0,0 +1,77 @@
+"""
+Shared fakes and helpers for the monitoring integration tests.
+"""
+
+from types import MappingProxyType
+from unittest.mock import AsyncMock, Mock
+
+from mcp_financial.auth.jwt_handler import UserContext
+
+
+# Caller the monitoring tool tests authenticate as; tuples keep the shared instance immutable
+DEFAULT_USER_CONTEXT = UserContext(
+    user_id="test-user",
+    username="testuser",
+    roles=("admin",),
+    permissions=("read", "write", "admin")
+)
+
+
+class FakeHealthChecker:
+    """HealthChecker stand-in exposing only the coroutines MonitoringTools awaits."""
+    
+    def __init__(self):
+        self.get_overall_health = AsyncMock()
+        self.check_account_service = AsyncMock()
+        self.check_transaction_service = AsyncMock()
+        self.check_all_services = AsyncMock()
+    
+    def reset_mock(self):
+        """Clear configured return values and side effects on every method."""
+        for method in vars(self).values():
+            method.reset_mock(return_value=True, side_effect=True)
+
+
+class FakeJWTAuthHandler:
+    """JWTAuthHandler stand-in exposing only extract_user_context."""
+    
+    def __init__(self, user_context=None):
+        self.extract_user_context = Mock(return_value=user_context)
+    
+    def reset_mock(self):
+        """Clear a configured side effect, keeping the seeded user context."""
+        self.extract_user_context.reset_mock(side_effect=True)
+
+
+def freeze(value):
+    """Recursively wrap dicts in read-only proxies and turn lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def overall_health(account="healthy", transaction="healthy", avg_response_time_ms=120.0):
+    """Build a frozen HealthChecker.get_overall_health payload for the two backend services."""
+    services = {"account-service": account, "transaction-service": transaction}
+    return freeze({
+        "status": "healthy" if set(services.values()) == {"healthy"} else "unhealthy",
+        "timestamp": "2024-01-01T10:00:00Z",
+        "services": {
+            name: {
+                "status": status,
+                "response_time_ms": avg_response_time_ms,
+                "error": None if status == "healthy" else "Service returned 503",
+                "timestamp": "2024-01-01T10:00:00Z",
+                "details": None
+            }
+            for name, status in services.items()
+        },
+        "metrics": {
+            "total_services": len(services),
+            "healthy_services": sum(status == "healthy" for status in services.values()),
+            "unhealthy_services": sum(status == "unhealthy" for status in services.values()),
+            "average_response_time_ms": avg_response_time_ms
+        }
+    })
@@ -3,18 +3,89 @@ Integration tests for circuit breaker functionality.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
-import sys
-import os
-from unittest.mock import AsyncMock, patch, MagicMock
-from datetime import datetime, timedelta
+import time
+from contextlib import ExitStack
+from functools import partial
+from typing import Callable
+from unittest.mock import AsyncMock, patch
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
-from mcp_financial.clients.base_client import BaseHTTPClient, CircuitBreaker, CircuitBreakerError, ServiceUnavailableError
+from mcp_financial.clients.base_client import (
+    BaseHTTPClient,
+    BreakerState,
+    CircuitBreaker,
+    CircuitBreakerError
+)
+from mcp_financial.exceptions.base import AuthenticationError, ServiceError, TimeoutError, ValidationError
 import httpx
 
+# Failure age (ns) well past the recovery timeouts used by these tests
+_PAST_RECOVERY_NS = 10 * 1_000_000_000
+
+
+def _response(status_code: int, **body) -> Callable[[], httpx.Response]:
+    """Return a factory for the response to serve, so every request gets a fresh one."""
+    if body:
+        return partial(httpx.Response, status_code, json=body)
+    return partial(httpx.Response, status_code)
+
+
+class ResponseSequence:
+    """Response factories (or exceptions to raise) served in order by a mock transport.
+    
+    The last outcome repeats once the others are used up, so a single
+    outcome behaves like a fixed return value.
+    """
+    
+    def __init__(self):
+        self.outcomes = []
+        self.call_count = 0
+    
+    def set(self, *outcomes):
+        """Replace the queued outcomes and reset the call count."""
+        self.outcomes = list(outcomes)
+        self.call_count = 0
+    
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Serve the next outcome for a request sent through the transport."""
+        self.call_count += 1
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome()
+
+
+@pytest.fixture(scope="session")
+def session_response_sequence():
+    """Response sequence backing the shared client's mock transport."""
+    return ResponseSequence()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def fast_circuit_breaker_client(session_response_sequence):
+    """Create one HTTP client with a fast circuit breaker, and no retries, for the whole session."""
+    client = BaseHTTPClient(
+        "http://localhost:8080",
+        timeout=1000,
+        max_retries=0,
+        circuit_breaker_failure_threshold=3,
+        circuit_breaker_recovery_timeout=2,
+        transport=httpx.MockTransport(session_response_sequence.handle)
+    )
+    yield client
+    await client.close()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def independent_client_pair():
+    """Create two clients for different services, shared by the module."""
+    client1 = BaseHTTPClient("http://service1:8080", max_retries=0, circuit_breaker_failure_threshold=2)
+    client2 = BaseHTTPClient("http://service2:8081", max_retries=0, circuit_breaker_failure_threshold=2)
+    yield client1, client2
+    await client1.close()
+    await client2.close()
+
 
 class TestCircuitBreakerIntegration:
     """Integration tests for circuit breaker behavior."""
@@ -25,50 +96,50 @@ class TestCircuitBreakerIntegration:
         return CircuitBreaker(failure_threshold=3, recovery_timeout=5)
     
     @pytest.fixture
-    def client_with_fast_circuit_breaker(self):
-        """Create HTTP client with fast circuit breaker for testing."""
-        return BaseHTTPClient(
-            "http://localhost:8080",
-            timeout=1000,
-            circuit_breaker_failure_threshold=3,
-            circuit_breaker_recovery_timeout=2
-        )
+    def response_sequence(self, session_response_sequence):
+        """Provide an empty response sequence for the shared client's transport."""
+        session_response_sequence.set()
+        return session_response_sequence
+    
+    @pytest.fixture
+    def client_with_fast_circuit_breaker(self, fast_circuit_breaker_client, response_sequence):
+        """Provide the shared fast-breaker client with its breaker reset to CLOSED."""
+        fast_circuit_breaker_client.circuit_breaker.reset()
+        return fast_circuit_breaker_client
     
     def test_circuit_breaker_state_transitions(self, circuit_breaker):
         """Test circuit breaker state transitions."""
         # Initially closed
-        assert circuit_breaker.state == "CLOSED"
+        assert circuit_breaker.state is BreakerState.CLOSED
         assert circuit_breaker.failure_count == 0
         
         # Simulate failures
         def failing_function():
             raise Exception("Service failure")
         
-        decorated_func = circuit_breaker.call(failing_function)
-        
         # First few failures should increment counter
         for i in range(2):
             with pytest.raises(Exception):
-                decorated_func()
-            assert circuit_breaker.state == "CLOSED"
+                circuit_breaker.execute(failing_function)
+            assert circuit_breaker.state is BreakerState.CLOSED
             assert circuit_breaker.failure_count == i + 1
         
         # Third failure should open circuit
         with pytest.raises(Exception):
-            decorated_func()
-        assert circuit_breaker.state == "OPEN"
+            circuit_breaker.execute(failing_function)
+        assert circuit_breaker.state is BreakerState.OPEN
         assert circuit_breaker.failure_count == 3
         
         # Further calls should raise CircuitBreakerError
         with pytest.raises(CircuitBreakerError):
-            decorated_func()
+            circuit_breaker.execute(failing_function)
     
     def test_circuit_breaker_recovery(self, circuit_breaker):
         """Test circuit breaker recovery after timeout."""
         # Force circuit to open state
         circuit_breaker.failure_count = 5
-        circuit_breaker.state = "OPEN"
-        circuit_breaker.last_failure_time = datetime.utcnow() - timedelta(seconds=10)
+        circuit_breaker.state = BreakerState.OPEN
+        circuit_breaker.last_failure_time = time.monotonic_ns() - _PAST_RECOVERY_NS
         
         # Should attempt reset after timeout
         assert circuit_breaker._should_attempt_reset() is True
@@ -77,237 +148,295 @@ class TestCircuitBreakerIntegration:
         def successful_function():
             return "success"
         
-        decorated_func = circuit_breaker.call(successful_function)
-        
         # First call after timeout should transition to HALF_OPEN
-        result = decorated_func()
+        result = circuit_breaker.execute(successful_function)
         assert result == "success"
-        assert circuit_breaker.state == "CLOSED"
+        assert circuit_breaker.state is BreakerState.HALF_OPEN
+        
+        # Three consecutive successes in HALF_OPEN close the circuit
+        for _ in range(2):
+            assert circuit_breaker.execute(successful_function) == "success"
+        assert circuit_breaker.state is BreakerState.CLOSED
+        assert circuit_breaker.failure_count == 0
+    
+    def test_circuit_breaker_reset(self, circuit_breaker):
+        """Test reset returns an open circuit breaker to CLOSED."""
+        def failing_function():
+            raise Exception("Service failure")
+        
+        for _ in range(3):
+            with pytest.raises(Exception):
+                circuit_breaker.execute(failing_function)
+        assert circuit_breaker.state is BreakerState.OPEN
+        
+        circuit_breaker.reset()
+        
+        assert circuit_breaker.state is BreakerState.CLOSED
         assert circuit_breaker.failure_count == 0
+        assert circuit_breaker.last_failure_time is None
+        assert circuit_breaker.execute(lambda: "success") == "success"
     
-    @pytest.mark.asyncio
-    async def test_http_client_circuit_breaker_integration(self, client_with_fast_circuit_breaker):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_http_client_circuit_breaker_integration(
+        self, client_with_fast_circuit_breaker, response_sequence
+    ):
         """Test circuit breaker integration with HTTP client."""
         client = client_with_fast_circuit_breaker
         
         # Mock consecutive connection failures
-        with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_request:
-            mock_request.side_effect = httpx.ConnectError("Connection failed")
-            
-            # First few failures should be retried and circuit should remain closed
-            for i in range(3):
-                with pytest.raises(ServiceUnavailableError):
-                    await client.get("/test")
-                
-                # Circuit should still be closed initially
-                if i < 2:
-                    assert client.circuit_breaker.state == "CLOSED"
-            
-            # Force circuit breaker to open state
-            client.circuit_breaker.failure_count = 5
-            client.circuit_breaker.state = "OPEN"
-            
-            # Now requests should fail immediately with CircuitBreakerError
-            with pytest.raises(CircuitBreakerError):
+        response_sequence.set(httpx.ConnectError("Connection failed"))
+        
+        # The client makes no retries, so each call is one failed request; the
+        # circuit stays closed below the failure threshold
+        for i in range(3):
+            with pytest.raises(ServiceError):
                 await client.get("/test")
             
-            # Verify no HTTP request was made (circuit breaker prevented it)
-            # The call count should still be 3 from the previous failures
-            assert mock_request.call_count >= 3
+            # Circuit should still be closed initially
+            if i < 2:
+                assert client.circuit_breaker.state is BreakerState.CLOSED
+        
+        # Force circuit breaker to open state
+        client.circuit_breaker.failure_count = 5
+        client.circuit_breaker.state = BreakerState.OPEN
+        
+        # Now requests should fail immediately with CircuitBreakerError
+        with pytest.raises(CircuitBreakerError):
+            await client.get("/test")
+        
+        # Verify no HTTP request was made (circuit breaker prevented it)
+        # The call count should still be 3 from the previous failures
+        assert response_sequence.call_count == 3
     
-    @pytest.mark.asyncio
-    async def test_circuit_breaker_recovery_with_http_client(self, client_with_fast_circuit_breaker):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_circuit_breaker_recovery_with_http_client(
+        self, client_with_fast_circuit_breaker, response_sequence
+    ):
         """Test circuit breaker recovery with HTTP client."""
         client = client_with_fast_circuit_breaker
         
         # Force circuit to open state with old failure time
         client.circuit_breaker.failure_count = 5
-        client.circuit_breaker.state = "OPEN"
-        client.circuit_breaker.last_failure_time = datetime.utcnow() - timedelta(seconds=10)
+        client.circuit_breaker.state = BreakerState.OPEN
+        client.circuit_breaker.last_failure_time = time.monotonic_ns() - _PAST_RECOVERY_NS
         
         # Mock successful response
-        with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_request:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"status": "success"}
-            mock_request.return_value = mock_response
-            
-            # Request should succeed and reset circuit breaker
-            result = await client.get("/test")
-            
-            assert result == {"status": "success"}
-            assert client.circuit_breaker.state == "CLOSED"
-            assert client.circuit_breaker.failure_count == 0
+        response_sequence.set(_response(200, status="success"))
+        
+        # First request succeeds as a HALF_OPEN probe
+        result = await client.get("/test")
+        
+        assert result == {"status": "success"}
+        assert client.circuit_breaker.state is BreakerState.HALF_OPEN
+        
+        # Three consecutive successful probes reset the circuit breaker
+        for _ in range(2):
+            assert await client.get("/test") == {"status": "success"}
+        assert client.circuit_breaker.state is BreakerState.CLOSED
+        assert client.circuit_breaker.failure_count == 0
     
-    @pytest.mark.asyncio
-    async def test_circuit_breaker_with_mixed_failures_and_successes(self, client_with_fast_circuit_breaker):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_circuit_breaker_with_mixed_failures_and_successes(
+        self, client_with_fast_circuit_breaker, response_sequence
+    ):
         """Test circuit breaker behavior with mixed failures and successes."""
         client = client_with_fast_circuit_breaker
         
-        with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_request:
-            # Simulate pattern: fail, fail, succeed, fail, fail, fail (should open)
-            responses = [
-                httpx.ConnectError("Connection failed"),
-                httpx.ConnectError("Connection failed"),
-                MagicMock(status_code=200, json=lambda: {"success": True}),
-                httpx.ConnectError("Connection failed"),
-                httpx.ConnectError("Connection failed"),
-                httpx.ConnectError("Connection failed")
-            ]
-            
-            mock_request.side_effect = responses
-            
-            # First two failures
-            for i in range(2):
-                with pytest.raises(ServiceUnavailableError):
-                    await client.get("/test")
-                assert client.circuit_breaker.state == "CLOSED"
-            
-            # Success should reset failure count
-            result = await client.get("/test")
-            assert result == {"success": True}
-            assert client.circuit_breaker.failure_count == 0
-            
-            # More failures should start counting again
-            for i in range(3):
-                with pytest.raises(ServiceUnavailableError):
-                    await client.get("/test")
-            
-            # Circuit should now be open
-            assert client.circuit_breaker.state == "OPEN"
+        # Simulate pattern: fail, fail, succeed, fail, fail, fail (should open)
+        response_sequence.set(
+            httpx.ConnectError("Connection failed"),
+            httpx.ConnectError("Connection failed"),
+            _response(200, success=True),
+            httpx.ConnectError("Connection failed"),
+            httpx.ConnectError("Connection failed"),
+            httpx.ConnectError("Connection failed")
+        )
+        
+        # First two failures
+        for i in range(2):
+            with pytest.raises(ServiceError):
+                await client.get("/test")
+            assert client.circuit_breaker.state is BreakerState.CLOSED
+        
+        # A success in CLOSED forgives one failure
+        result = await client.get("/test")
+        assert result == {"success": True}
+        assert client.circuit_breaker.failure_count == 1
+        
+        # Two more failures reach the threshold of 3 and open the circuit
+        for _ in range(2):
+            with pytest.raises(ServiceError):
+                await client.get("/test")
+        assert client.circuit_breaker.state is BreakerState.OPEN
+        
+        # The open circuit rejects the next call without sending it
+        with pytest.raises(CircuitBreakerError):
+            await client.get("/test")
+        assert response_sequence.call_count == 5
     
-    @pytest.mark.asyncio
-    async def test_circuit_breaker_with_different_error_types(self, client_with_fast_circuit_breaker):
-        """Test circuit breaker behavior with different types of errors."""
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("outcome,expected_error,expected_state,expected_failures", [
+        pytest.param(httpx.ConnectError("Connection failed"), ServiceError, BreakerState.OPEN, 3, id="connect-error"),
+        pytest.param(httpx.TimeoutException("Request timeout"), TimeoutError, BreakerState.OPEN, 3, id="timeout"),
+        # 4xx responses are client-side problems and must not trip the breaker
+        pytest.param(_response(404), ValidationError, BreakerState.CLOSED, 0, id="http-404"),
+        # 503 Service Unavailable should trip the breaker
+        pytest.param(_response(503), ServiceError, BreakerState.OPEN, 3, id="http-503"),
+    ])
+    async def test_circuit_breaker_by_error_type(
+        self,
+        client_with_fast_circuit_breaker,
+        response_sequence,
+        outcome,
+        expected_error,
+        expected_state,
+        expected_failures
+    ):
+        """Test which kinds of errors count as circuit breaker failures."""
         client = client_with_fast_circuit_breaker
+        response_sequence.set(outcome)
         
-        with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_request:
-            # Mix of different error types
-            errors = [
-                httpx.ConnectError("Connection failed"),
-                httpx.TimeoutException("Request timeout"),
-                httpx.ConnectError("Connection failed")
-            ]
-            
-            mock_request.side_effect = errors
-            
-            # All should be treated as failures for circuit breaker
-            for error in errors:
-                with pytest.raises(ServiceUnavailableError):
-                    await client.get("/test")
-            
-            # Circuit should be open after threshold failures
-            assert client.circuit_breaker.state == "OPEN"
-            assert client.circuit_breaker.failure_count == 3
+        # Threshold is 3, so three failures are enough to open the circuit
+        caught = 0
+        for _ in range(3):
+            try:
+                await client.get("/test")
+            except expected_error:
+                caught += 1
+        assert caught == 3
+        
+        assert client.circuit_breaker.state is expected_state
+        assert client.circuit_breaker.failure_count == expected_failures
     
-    @pytest.mark.asyncio
-    async def test_circuit_breaker_does_not_trigger_on_http_errors(self, client_with_fast_circuit_breaker):
-        """Test that HTTP status errors don't trigger circuit breaker."""
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("status,expected_error", [
+        pytest.param(400, ValidationError, id="http-400"),
+        pytest.param(401, AuthenticationError, id="http-401"),
+        pytest.param(404, ValidationError, id="http-404"),
+    ])
+    async def test_client_errors_pass_through_circuit_breaker(
+        self, client_with_fast_circuit_breaker, response_sequence, status, expected_error
+    ):
+        """Test 4xx errors reach the caller unwrapped and never count as breaker failures."""
         client = client_with_fast_circuit_breaker
+        response_sequence.set(_response(status))
         
-        with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_request:
-            # HTTP 404 error should not trigger circuit breaker
-            mock_response = MagicMock()
-            mock_response.status_code = 404
-            mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "404 Not Found", request=MagicMock(), response=mock_response
-            )
-            mock_request.return_value = mock_response
-            
-            # Multiple 404s should not open circuit breaker
-            for i in range(5):
-                with pytest.raises(httpx.HTTPStatusError):
-                    await client.get("/test")
-            
-            # Circuit should still be closed (HTTP errors don't count as failures)
-            assert client.circuit_breaker.state == "CLOSED"
-            assert client.circuit_breaker.failure_count == 0
+        # More client errors than the failure threshold still leave the circuit closed
+        for _ in range(client.circuit_breaker.failure_threshold + 1):
+            with pytest.raises(expected_error) as exc_info:
+                await client.get("/test")
+            assert exc_info.value.details["status_code"] == status
+            assert "unexpected error" not in exc_info.value.message.lower()
+        
+        assert client.circuit_breaker.state is BreakerState.CLOSED
+        assert client.circuit_breaker.failure_count == 0
     
-    @pytest.mark.asyncio
-    async def test_circuit_breaker_with_service_unavailable_503(self, client_with_fast_circuit_breaker):
-        """Test circuit breaker behavior with 503 Service Unavailable."""
-        client = client_with_fast_circuit_breaker
+    def test_uncounted_errors_release_half_open_probes(self):
+        """Test 4xx probes in HALF_OPEN neither reopen the circuit nor use up the probe limit."""
+        clock = [0]
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            recovery_timeout=1,
+            time_source=lambda: clock[0],
+            failure_exceptions=(ServiceError, TimeoutError)
+        )
         
-        with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_request:
-            # 503 Service Unavailable should trigger circuit breaker
-            mock_response = MagicMock()
-            mock_response.status_code = 503
-            mock_request.return_value = mock_response
-            
-            # Multiple 503s should open circuit breaker
-            for i in range(3):
-                with pytest.raises(ServiceUnavailableError):
-                    await client.get("/test")
-            
-            # Circuit should be open
-            assert client.circuit_breaker.state == "OPEN"
+        def counted_failure():
+            raise ServiceError("Service unavailable")
+        
+        def client_error():
+            raise ValidationError("Bad request")
+        
+        with pytest.raises(ServiceError):
+            breaker.execute(counted_failure)
+        assert breaker.state is BreakerState.OPEN
+        
+        # More uncounted probes than half_open_max_calls after the recovery timeout
+        clock[0] += _PAST_RECOVERY_NS
+        for _ in range(breaker.half_open_max_calls + 1):
+            with pytest.raises(ValidationError):
+                breaker.execute(client_error)
+            assert breaker.state is BreakerState.HALF_OPEN
+            assert breaker.half_open_calls == 0
+        
+        # The circuit still admits probes, and successful ones close it
+        for _ in range(3):
+            breaker.execute(lambda: "ok")
+        assert breaker.state is BreakerState.CLOSED
     
-    @pytest.mark.asyncio
-    async def test_multiple_clients_independent_circuit_breakers(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_multiple_clients_independent_circuit_breakers(self, independent_client_pair):
         """Test that different client instances have independent circuit breakers."""
-        client1 = BaseHTTPClient("http://service1:8080", circuit_breaker_failure_threshold=2)
-        client2 = BaseHTTPClient("http://service2:8081", circuit_breaker_failure_threshold=2)
+        client1, client2 = independent_client_pair
+        client1.circuit_breaker.reset()
+        client2.circuit_breaker.reset()
         
-        try:
+        with ExitStack() as stack:
+            mock_request1 = stack.enter_context(
+                patch.object(client1.client, 'request', new_callable=AsyncMock)
+            )
+            mock_request2 = stack.enter_context(
+                patch.object(client2.client, 'request', new_callable=AsyncMock)
+            )
+            
             # Fail client1's circuit breaker
-            with patch.object(client1.client, 'request', new_callable=AsyncMock) as mock_request1:
-                mock_request1.side_effect = httpx.ConnectError("Connection failed")
-                
-                for i in range(2):
-                    with pytest.raises(ServiceUnavailableError):
-                        await client1.get("/test")
-                
-                # Force client1 circuit to open
-                client1.circuit_breaker.failure_count = 5
-                client1.circuit_breaker.state = "OPEN"
-                
-                # Client1 should have open circuit
-                assert client1.circuit_breaker.state == "OPEN"
-                
-                # Client2 should still have closed circuit
-                assert client2.circuit_breaker.state == "CLOSED"
-                
-                # Client1 requests should fail with CircuitBreakerError
-                with pytest.raises(CircuitBreakerError):
+            mock_request1.side_effect = httpx.ConnectError("Connection failed")
+            
+            caught = 0
+            for _ in range(2):
+                try:
                     await client1.get("/test")
-                
-                # Client2 should still work (with mocked success)
-                with patch.object(client2.client, 'request', new_callable=AsyncMock) as mock_request2:
-                    mock_response = MagicMock()
-                    mock_response.status_code = 200
-                    mock_response.json.return_value = {"success": True}
-                    mock_request2.return_value = mock_response
-                    
-                    result = await client2.get("/test")
-                    assert result == {"success": True}
-                    assert client2.circuit_breaker.state == "CLOSED"
-        
-        finally:
-            await client1.close()
-            await client2.close()
+                except ServiceError:
+                    caught += 1
+            assert caught == 2
+            
+            # Force client1 circuit to open
+            client1.circuit_breaker.failure_count = 5
+            client1.circuit_breaker.state = BreakerState.OPEN
+            
+            # Client1 should have open circuit
+            assert client1.circuit_breaker.state is BreakerState.OPEN
+            
+            # Client2 should still have closed circuit
+            assert client2.circuit_breaker.state is BreakerState.CLOSED
+            
+            # Client1 requests should fail with CircuitBreakerError
+            with pytest.raises(CircuitBreakerError):
+                await client1.get("/test")
+            
+            # Client2 should still work (with mocked success)
+            mock_request2.return_value = httpx.Response(
+                200,
+                json={"success": True},
+                request=httpx.Request("GET", "http://service2:8081/test")
+            )
+            
+            result = await client2.get("/test")
+            assert result == {"success": True}
+            assert client2.circuit_breaker.state is BreakerState.CLOSED
     
-    @pytest.mark.asyncio
-    async def test_circuit_breaker_metrics_and_logging(self, client_with_fast_circuit_breaker):
+    def test_circuit_breaker_metrics_and_logging(self):
         """Test that circuit breaker state changes are properly logged."""
-        client = client_with_fast_circuit_breaker
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=2)
         
         with patch('mcp_financial.clients.base_client.logger') as mock_logger:
             # Force circuit breaker to open
-            client.circuit_breaker.failure_count = 5
-            client.circuit_breaker.state = "OPEN"
-            client.circuit_breaker.last_failure_time = datetime.utcnow()
+            breaker.failure_count = 5
+            breaker.state = BreakerState.OPEN
+            breaker.last_failure_time = time.monotonic_ns()
             
             # Trigger logging by calling _on_failure
-            client.circuit_breaker._on_failure()
+            breaker._on_failure(Exception("Service failure"))
             
             # Should log circuit breaker opening
-            mock_logger.warning.assert_called_with(
-                "Circuit breaker opened after 6 failures"
+            mock_logger.error.assert_called_with(
+                "Circuit breaker opened after %d failures", 6
             )
             
-            # Test recovery logging
-            client.circuit_breaker.state = "HALF_OPEN"
-            client.circuit_breaker._on_success()
+            # Test recovery logging; HALF_OPEN needs consecutive successes to close
+            breaker.state = BreakerState.HALF_OPEN
+            for _ in range(3):
+                breaker._on_success()
             
             # Should log circuit breaker reset
-            mock_logger.info.assert_called_with("Circuit breaker reset to CLOSED")
\ No newline at end of file
+            mock_logger.info.assert_called_with("Circuit breaker reset to CLOSED after successful calls")
\ No newline at end of file
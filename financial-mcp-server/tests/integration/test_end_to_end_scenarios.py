@@ -3,495 +3,473 @@ End-to-end integration tests with real backend services.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+import logging
+import httpx
+from contextlib import ExitStack
+from unittest.mock import AsyncMock, patch
 from decimal import Decimal
-from datetime import datetime, timedelta
+from types import MappingProxyType, SimpleNamespace
 
 from mcp_financial.server import FinancialMCPServer
 from mcp_financial.auth.jwt_handler import JWTAuthHandler, UserContext
+from mcp_financial.auth.permissions import PermissionChecker
 
 
+# Users the scenarios run as, with immutable role/permission collections
+_CUSTOMER_TOKEN = "Bearer customer.jwt.token"
+_OFFICER_TOKEN = "Bearer officer.jwt.token"
+
+_CUSTOMER_CTX = UserContext(
+    user_id="customer_123",
+    username="john_doe",
+    roles=("customer",),
+    permissions=(
+        "account:read", "account:create", "account:update",
+        "transaction:create", "transaction:read"
+    )
+)
+_OFFICER_CTX = UserContext(
+    user_id="officer_456",
+    username="jane_smith",
+    roles=("financial_officer",),
+    permissions=(
+        "account:read", "account:create", "account:update", "account:delete",
+        "transaction:create", "transaction:read", "transaction:reverse",
+        "account:balance:update"
+    )
+)
+
+# Canned backend responses, shared read-only across tests
+_LIFECYCLE_ACCOUNT = MappingProxyType({
+    "id": "acc_lifecycle_123",
+    "ownerId": "customer_123",
+    "accountType": "CHECKING",
+    "balance": 0.0,
+    "status": "ACTIVE",
+    "createdAt": "2024-01-01T10:00:00Z"
+})
+_LIFECYCLE_ACCOUNT_DETAILS = MappingProxyType({
+    "id": "acc_lifecycle_123",
+    "ownerId": "customer_123",
+    "balance": 1000.0,
+    "status": "ACTIVE"
+})
+_LIFECYCLE_DEPOSIT = MappingProxyType({
+    "id": "txn_deposit_123",
+    "accountId": "acc_lifecycle_123",
+    "amount": 1000.0,
+    "transactionType": "DEPOSIT",
+    "status": "COMPLETED"
+})
+_LIFECYCLE_BALANCE = MappingProxyType({
+    "accountId": "acc_lifecycle_123",
+    "balance": 1000.0,
+    "availableBalance": 1000.0,
+    "lastUpdated": "2024-01-01T10:30:00Z"
+})
+_LIFECYCLE_WITHDRAWAL = MappingProxyType({
+    "id": "txn_withdraw_123",
+    "accountId": "acc_lifecycle_123",
+    "amount": -200.0,
+    "transactionType": "WITHDRAWAL",
+    "status": "COMPLETED"
+})
+_LIFECYCLE_HISTORY = MappingProxyType({
+    "content": (
+        {
+            "id": "txn_deposit_123",
+            "accountId": "acc_lifecycle_123",
+            "amount": 1000.0,
+            "transactionType": "DEPOSIT",
+            "createdAt": "2024-01-01T10:00:00Z"
+        },
+        {
+            "id": "txn_withdraw_123",
+            "accountId": "acc_lifecycle_123",
+            "amount": -200.0,
+            "transactionType": "WITHDRAWAL",
+            "createdAt": "2024-01-01T10:30:00Z"
+        }
+    ),
+    "totalElements": 2
+})
+_TRANSFER_SOURCE_ACCOUNT = MappingProxyType({
+    "id": "acc_source_123",
+    "ownerId": "customer_123",
+    "balance": 1500.0,
+    "status": "ACTIVE"
+})
+_TRANSFER_DEST_ACCOUNT = MappingProxyType({"id": "acc_dest_456", "ownerId": "customer_456", "status": "ACTIVE"})
+_TRANSFER_SOURCE_BALANCE = MappingProxyType({
+    "accountId": "acc_source_123",
+    "balance": 1500.0,
+    "availableBalance": 1500.0
+})
+_TRANSFER = MappingProxyType({
+    "id": "txn_transfer_789",
+    "fromAccountId": "acc_source_123",
+    "toAccountId": "acc_dest_456",
+    "amount": 500.0,
+    "transactionType": "TRANSFER",
+    "status": "COMPLETED",
+    "description": "Transfer to friend"
+})
+_BALANCE_ADJUSTMENT = MappingProxyType({
+    "accountId": "acc_adjustment_123",
+    "balance": 2500.0,
+    "lastUpdated": "2024-01-01T11:00:00Z",
+    "reason": "Manual adjustment - error correction"
+})
+_REVERSAL = MappingProxyType({
+    "id": "txn_reversal_789",
+    "originalTransactionId": "txn_to_reverse_456",
+    "amount": -100.0,
+    "transactionType": "REVERSAL",
+    "status": "COMPLETED",
+    "reason": "Customer dispute resolution"
+})
+_RECOVERY_ACCOUNT = MappingProxyType({
+    "id": "acc_recovery_123",
+    "ownerId": "customer_123",
+    "balance": 1000.0,
+    "status": "ACTIVE"
+})
+_CONCURRENT_ACCOUNT = MappingProxyType({
+    "id": "acc_concurrent_123",
+    "ownerId": "customer_123",
+    "status": "ACTIVE"
+})
+_CONCURRENT_BALANCE = MappingProxyType({
+    "accountId": "acc_concurrent_123",
+    "balance": 1000.0,
+    "availableBalance": 1000.0
+})
+
+
+_AUDITED_TRANSACTION = MappingProxyType({
+    "id": "txn_audit_456",
+    "accountId": "acc_audit_123",
+    "amount": 250.0,
+    "transactionType": "DEPOSIT",
+    "status": "COMPLETED"
+})
+_AUDIT_REVERSAL = MappingProxyType({
+    "transactionId": "txn_audit_reversal_789",
+    "originalTransactionId": "txn_audit_456",
+    "amount": -250.0,
+    "transactionType": "REVERSAL",
+    "status": "COMPLETED"
+})
+
+# Only the fields FinancialMCPServer reads during construction and tool registration
+_E2E_SETTINGS = SimpleNamespace(
+    account_service_url="http://localhost:8080",
+    transaction_service_url="http://localhost:8081",
+    jwt_secret="test-secret-key",
+    http_timeout=5000,
+    max_retries=3,
+    retry_delay=1.0,
+    log_level="INFO",
+    log_format="json",
+    metrics_enabled=False,
+    metrics_port=9090
+)
+
+
+# Service client calls the scenarios stub out, by client attribute on the server
+_MOCKED_BACKEND_CALLS = MappingProxyType({
+    "account_client": ("create_account", "get_account", "get_account_balance", "update_account_balance"),
+    "transaction_client": (
+        "deposit_funds", "withdraw_funds", "transfer_funds",
+        "get_transaction", "reverse_transaction", "get_transaction_history"
+    ),
+})
+
+
+def _json_response(body) -> httpx.Response:
+    """Build a 200 backend response for a patched client.request."""
+    return httpx.Response(200, json=dict(body), request=httpx.Request("GET", "http://localhost:8080"))
+
+
+async def _call_tool(server, name, **arguments):
+    """Call a tool registered on the server's FastMCP app and return its content blocks."""
+    content, _ = await server.app.call_tool(name, arguments)
+    return content
+
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestEndToEndScenarios:
     """End-to-end integration test scenarios."""
     
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def _allow_all_permissions(self, monkeypatch):
+        """Grant every permission check; these scenarios exercise tool flows, not RBAC."""
+        for name in ("can_access_account", "can_create_account", "has_permission"):
+            monkeypatch.setattr(PermissionChecker, name, staticmethod(lambda *args, **kwargs: True))
+    
+    @pytest_asyncio.fixture(loop_scope="session")
     async def e2e_server(self):
-        """Create server for end-to-end testing."""
-        with patch('mcp_financial.server.Settings') as mock_settings_class:
-            mock_settings = MagicMock()
-            mock_settings.account_service_url = "http://localhost:8080"
-            mock_settings.transaction_service_url = "http://localhost:8081"
-            mock_settings.jwt_secret = "test-secret-key"
-            mock_settings.server_timeout = 5000
-            mock_settings_class.return_value = mock_settings
-            
-            server = FinancialMCPServer()
+        """Create a server per test with its tools registered and authentication mocked."""
+        server = FinancialMCPServer(_E2E_SETTINGS)
+        await server._register_tools()
+        
+        with patch.object(server.auth_handler, 'extract_user_context'):
             yield server
+        
+        await server.account_client.close()
+        await server.transaction_client.close()
+        await server.health_checker.close()
     
     @pytest.fixture
+    def mocked_backend(self, e2e_server):
+        """Mock the backend service calls on the client instances the tools hold."""
+        with ExitStack() as stack:
+            for client_name, method_names in _MOCKED_BACKEND_CALLS.items():
+                client = getattr(e2e_server, client_name)
+                for method_name in method_names:
+                    stack.enter_context(patch.object(client, method_name, new_callable=AsyncMock))
+            yield
+    
+    @pytest.fixture(scope="session")
     def customer_user_context(self):
         """Customer user context for testing."""
-        return UserContext(
-            user_id="customer_123",
-            username="john_doe",
-            roles=["customer"],
-            permissions=[
-                "account:read", "account:create", "account:update",
-                "transaction:create", "transaction:read"
-            ]
-        )
+        return _CUSTOMER_CTX
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def financial_officer_context(self):
         """Financial officer user context for testing."""
-        return UserContext(
-            user_id="officer_456",
-            username="jane_smith",
-            roles=["financial_officer"],
-            permissions=[
-                "account:read", "account:create", "account:update", "account:delete",
-                "transaction:create", "transaction:read", "transaction:reverse",
-                "account:balance:update"
-            ]
-        )
+        return _OFFICER_CTX
     
-    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mocked_backend")
     async def test_complete_account_lifecycle(self, e2e_server, customer_user_context):
         """Test complete account lifecycle from creation to closure."""
-        auth_token = "Bearer customer.jwt.token"
+        auth_token = _CUSTOMER_TOKEN
+        account_client = e2e_server.account_client
+        transaction_client = e2e_server.transaction_client
         
         # Mock authentication
-        with patch.object(e2e_server.auth_handler, 'extract_user_context') as mock_auth:
-            mock_auth.return_value = customer_user_context
-            
-            # Step 1: Create account
-            with patch.object(e2e_server.account_client, 'create_account', new_callable=AsyncMock) as mock_create:
-                mock_create.return_value = {
-                    "id": "acc_lifecycle_123",
-                    "ownerId": "customer_123",
-                    "accountType": "CHECKING",
-                    "balance": 0.0,
-                    "status": "ACTIVE",
-                    "createdAt": "2024-01-01T10:00:00Z"
-                }
-                
-                with patch('mcp_financial.tools.account_tools.PermissionChecker.can_create_account', return_value=True):
-                    create_result = await e2e_server.account_tools.create_account(
-                        "customer_123", "CHECKING", 0.0, auth_token
-                    )
-                
-                # Verify account creation
-                create_data = json.loads(create_result[0].text)
-                assert create_data["success"] is True
-                account_id = create_data["data"]["id"]
-                assert account_id == "acc_lifecycle_123"
-            
-            # Step 2: Make initial deposit
-            with patch.object(e2e_server.account_client, 'get_account', new_callable=AsyncMock) as mock_get_account, \
-                 patch.object(e2e_server.transaction_client, 'deposit_funds', new_callable=AsyncMock) as mock_deposit:
-                
-                mock_get_account.return_value = {
-                    "id": account_id,
-                    "ownerId": "customer_123",
-                    "status": "ACTIVE"
-                }
-                
-                mock_deposit.return_value = {
-                    "id": "txn_deposit_123",
-                    "accountId": account_id,
-                    "amount": 1000.0,
-                    "transactionType": "DEPOSIT",
-                    "status": "COMPLETED"
-                }
-                
-                with patch('mcp_financial.tools.transaction_tools.PermissionChecker.can_access_account', return_value=True):
-                    deposit_result = await e2e_server.transaction_tools.deposit_funds(
-                        account_id, 1000.0, "Initial deposit", auth_token
-                    )
-                
-                # Verify deposit
-                deposit_data = json.loads(deposit_result[0].text)
-                assert deposit_data["success"] is True
-                assert deposit_data["data"]["amount"] == 1000.0
-            
-            # Step 3: Check account balance
-            with patch.object(e2e_server.account_client, 'get_account_balance', new_callable=AsyncMock) as mock_balance:
-                mock_balance.return_value = {
-                    "accountId": account_id,
-                    "balance": 1000.0,
-                    "availableBalance": 1000.0,
-                    "lastUpdated": "2024-01-01T10:30:00Z"
-                }
-                
-                with patch('mcp_financial.tools.account_tools.PermissionChecker.can_access_account', return_value=True):
-                    balance_result = await e2e_server.account_tools.get_account_balance(
-                        account_id, auth_token
-                    )
-                
-                # Verify balance
-                balance_data = json.loads(balance_result[0].text)
-                assert balance_data["success"] is True
-                assert balance_data["data"]["balance"] == 1000.0
-            
-            # Step 4: Make withdrawal
-            with patch.object(e2e_server.account_client, 'get_account_balance', new_callable=AsyncMock) as mock_balance2, \
-                 patch.object(e2e_server.transaction_client, 'withdraw_funds', new_callable=AsyncMock) as mock_withdraw:
-                
-                mock_balance2.return_value = {
-                    "accountId": account_id,
-                    "balance": 1000.0,
-                    "availableBalance": 1000.0
-                }
-                
-                mock_withdraw.return_value = {
-                    "id": "txn_withdraw_123",
-                    "accountId": account_id,
-                    "amount": -200.0,
-                    "transactionType": "WITHDRAWAL",
-                    "status": "COMPLETED"
-                }
-                
-                with patch('mcp_financial.tools.transaction_tools.PermissionChecker.can_access_account', return_value=True):
-                    withdraw_result = await e2e_server.transaction_tools.withdraw_funds(
-                        account_id, 200.0, "ATM withdrawal", auth_token
-                    )
-                
-                # Verify withdrawal
-                withdraw_data = json.loads(withdraw_result[0].text)
-                assert withdraw_data["success"] is True
-                assert withdraw_data["data"]["amount"] == -200.0
-            
-            # Step 5: Get transaction history
-            with patch.object(e2e_server.transaction_client, 'get_transaction_history', new_callable=AsyncMock) as mock_history:
-                mock_history.return_value = {
-                    "content": [
-                        {
-                            "id": "txn_deposit_123",
-                            "accountId": account_id,
-                            "amount": 1000.0,
-                            "transactionType": "DEPOSIT",
-                            "createdAt": "2024-01-01T10:00:00Z"
-                        },
-                        {
-                            "id": "txn_withdraw_123",
-                            "accountId": account_id,
-                            "amount": -200.0,
-                            "transactionType": "WITHDRAWAL",
-                            "createdAt": "2024-01-01T10:30:00Z"
-                        }
-                    ],
-                    "totalElements": 2
-                }
-                
-                with patch('mcp_financial.tools.query_tools.PermissionChecker.can_access_account', return_value=True):
-                    history_result = await e2e_server.query_tools.get_transaction_history(
-                        account_id, 0, 20, None, None, auth_token
-                    )
-                
-                # Verify transaction history
-                history_data = json.loads(history_result[0].text)
-                assert history_data["success"] is True
-                assert len(history_data["data"]["content"]) == 2
-    
-    @pytest.mark.asyncio
-    async def test_multi_account_transfer_scenario(self, e2e_server, customer_user_context):
-        """Test transfer between multiple accounts."""
-        auth_token = "Bearer customer.jwt.token"
+        e2e_server.auth_handler.extract_user_context.return_value = customer_user_context
+        
+        # Step 1: Create account
+        account_client.create_account.return_value = _LIFECYCLE_ACCOUNT
         
-        with patch.object(e2e_server.auth_handler, 'extract_user_context') as mock_auth:
-            mock_auth.return_value = customer_user_context
-            
-            # Setup: Two accounts exist
-            source_account = "acc_source_123"
-            dest_account = "acc_dest_456"
-            
-            with patch.object(e2e_server.account_client, 'get_account', new_callable=AsyncMock) as mock_get_account, \
-                 patch.object(e2e_server.account_client, 'get_account_balance', new_callable=AsyncMock) as mock_balance, \
-                 patch.object(e2e_server.transaction_client, 'transfer_funds', new_callable=AsyncMock) as mock_transfer:
-                
-                # Mock account details
-                mock_get_account.side_effect = [
-                    {"id": source_account, "ownerId": "customer_123", "status": "ACTIVE"},
-                    {"id": dest_account, "ownerId": "customer_456", "status": "ACTIVE"}
-                ]
-                
-                # Mock sufficient balance
-                mock_balance.return_value = {
-                    "accountId": source_account,
-                    "balance": 1500.0,
-                    "availableBalance": 1500.0
-                }
-                
-                # Mock successful transfer
-                mock_transfer.return_value = {
-                    "id": "txn_transfer_789",
-                    "fromAccountId": source_account,
-                    "toAccountId": dest_account,
-                    "amount": 500.0,
-                    "transactionType": "TRANSFER",
-                    "status": "COMPLETED",
-                    "description": "Transfer to friend"
-                }
-                
-                with patch('mcp_financial.tools.transaction_tools.PermissionChecker.can_access_account', return_value=True):
-                    transfer_result = await e2e_server.transaction_tools.transfer_funds(
-                        source_account, dest_account, 500.0, "Transfer to friend", auth_token
-                    )
-                
-                # Verify transfer
-                transfer_data = json.loads(transfer_result[0].text)
-                assert transfer_data["success"] is True
-                assert transfer_data["data"]["amount"] == 500.0
-                assert transfer_data["data"]["fromAccountId"] == source_account
-                assert transfer_data["data"]["toAccountId"] == dest_account
+        create_result = await _call_tool(
+            e2e_server, "create_account",
+            owner_id="customer_123", account_type="CHECKING", initial_balance=0.0, auth_token=auth_token
+        )
+        
+        # Verify account creation
+        create_data = json.loads(create_result[0].text)
+        assert create_data["success"] is True
+        account_id = create_data["data"]["id"]
+        assert account_id == "acc_lifecycle_123"
+        
+        # Steps 2-5 only depend on the account existing, so run them together:
+        # deposit, balance check, withdrawal and transaction history
+        account_client.get_account.return_value = _LIFECYCLE_ACCOUNT_DETAILS
+        account_client.get_account_balance.return_value = _LIFECYCLE_BALANCE
+        transaction_client.deposit_funds.return_value = _LIFECYCLE_DEPOSIT
+        transaction_client.withdraw_funds.return_value = _LIFECYCLE_WITHDRAWAL
+        transaction_client.get_transaction_history.return_value = _LIFECYCLE_HISTORY
+        
+        deposit_result, balance_result, withdraw_result, history_result = await asyncio.gather(
+            _call_tool(
+                e2e_server, "deposit_funds",
+                account_id=account_id, amount=1000.0, description="Initial deposit", auth_token=auth_token
+            ),
+            _call_tool(
+                e2e_server, "get_account_balance",
+                account_id=account_id, auth_token=auth_token
+            ),
+            _call_tool(
+                e2e_server, "withdraw_funds",
+                account_id=account_id, amount=200.0, description="ATM withdrawal", auth_token=auth_token
+            ),
+            _call_tool(
+                e2e_server, "get_transaction_history",
+                account_id=account_id, page=0, size=20, auth_token=auth_token
+            )
+        )
+        
+        # Verify deposit
+        deposit_data = json.loads(deposit_result[0].text)
+        assert deposit_data["success"] is True
+        assert deposit_data["data"]["amount"] == 1000.0
+        
+        # Verify balance
+        balance_data = json.loads(balance_result[0].text)
+        assert balance_data["success"] is True
+        assert balance_data["data"]["balance"] == 1000.0
+        
+        # Verify withdrawal
+        withdraw_data = json.loads(withdraw_result[0].text)
+        assert withdraw_data["success"] is True
+        assert withdraw_data["data"]["amount"] == -200.0
+        
+        # Verify transaction history (the query tools answer with formatted text)
+        history_text = history_result[0].text
+        assert "Transaction History for Account acc_lifecycle_123" in history_text
+        assert "Total: 2 transactions" in history_text
     
-    @pytest.mark.asyncio
-    async def test_financial_officer_operations(self, e2e_server, financial_officer_context):
-        """Test financial officer privileged operations."""
-        auth_token = "Bearer officer.jwt.token"
+    @pytest.mark.parametrize("user_context,auth_token,mocks,tool_call,expected", [
+        pytest.param(
+            _CUSTOMER_CTX,
+            _CUSTOMER_TOKEN,
+            (
+                ("account_client", "get_account", "side_effect", (_TRANSFER_SOURCE_ACCOUNT, _TRANSFER_DEST_ACCOUNT)),
+                ("account_client", "get_account_balance", "return_value", _TRANSFER_SOURCE_BALANCE),
+                ("transaction_client", "transfer_funds", "return_value", _TRANSFER)
+            ),
+            ("transfer_funds", {"from_account_id": "acc_source_123", "to_account_id": "acc_dest_456", "amount": 500.0, "description": "Transfer to friend"}),
+            {"amount": 500.0, "fromAccountId": "acc_source_123", "toAccountId": "acc_dest_456"},
+            id="multi-account-transfer"
+        ),
+        pytest.param(
+            _OFFICER_CTX,
+            _OFFICER_TOKEN,
+            (("account_client", "update_account_balance", "return_value", _BALANCE_ADJUSTMENT),),
+            ("update_account_balance", {"account_id": "acc_adjustment_123", "new_balance": 2500.0, "reason": "Manual adjustment - error correction"}),
+            {"balance": 2500.0},
+            id="officer-balance-adjustment"
+        ),
+        pytest.param(
+            _OFFICER_CTX,
+            _OFFICER_TOKEN,
+            (("transaction_client", "reverse_transaction", "return_value", _REVERSAL),),
+            ("reverse_transaction", {"transaction_id": "txn_to_reverse_456", "reason": "Customer dispute resolution"}),
+            {"originalTransactionId": "txn_to_reverse_456"},
+            id="officer-transaction-reversal"
+        ),
+    ])
+    @pytest.mark.usefixtures("mocked_backend")
+    async def test_single_tool_happy_path(self, e2e_server, user_context, auth_token, mocks, tool_call, expected):
+        """Test single tool calls that succeed: transfers and financial officer operations."""
+        e2e_server.auth_handler.extract_user_context.return_value = user_context
+        
+        # Mock the backend responses the tool relies on
+        for client_name, method_name, mock_attr, value in mocks:
+            setattr(getattr(getattr(e2e_server, client_name), method_name), mock_attr, value)
+        
+        tool_name, arguments = tool_call
+        result = await _call_tool(e2e_server, tool_name, **arguments, auth_token=auth_token)
         
-        with patch.object(e2e_server.auth_handler, 'extract_user_context') as mock_auth:
-            mock_auth.return_value = financial_officer_context
-            
-            # Test 1: Manual balance adjustment
-            account_id = "acc_adjustment_123"
-            
-            with patch.object(e2e_server.account_client, 'update_account_balance', new_callable=AsyncMock) as mock_update_balance:
-                mock_update_balance.return_value = {
-                    "accountId": account_id,
-                    "balance": 2500.0,
-                    "lastUpdated": "2024-01-01T11:00:00Z",
-                    "reason": "Manual adjustment - error correction"
-                }
-                
-                with patch('mcp_financial.tools.account_tools.PermissionChecker.has_permission', return_value=True):
-                    adjustment_result = await e2e_server.account_tools.update_account_balance(
-                        account_id, 2500.0, "Manual adjustment - error correction", auth_token
-                    )
-                
-                # Verify balance adjustment
-                adjustment_data = json.loads(adjustment_result[0].text)
-                assert adjustment_data["success"] is True
-                assert adjustment_data["data"]["balance"] == 2500.0
-            
-            # Test 2: Transaction reversal
-            transaction_id = "txn_to_reverse_456"
-            
-            with patch.object(e2e_server.transaction_client, 'reverse_transaction', new_callable=AsyncMock) as mock_reverse:
-                mock_reverse.return_value = {
-                    "id": "txn_reversal_789",
-                    "originalTransactionId": transaction_id,
-                    "amount": -100.0,
-                    "transactionType": "REVERSAL",
-                    "status": "COMPLETED",
-                    "reason": "Customer dispute resolution"
-                }
-                
-                with patch('mcp_financial.tools.transaction_tools.PermissionChecker.has_permission', return_value=True):
-                    reversal_result = await e2e_server.transaction_tools.reverse_transaction(
-                        transaction_id, "Customer dispute resolution", auth_token
-                    )
-                
-                # Verify transaction reversal
-                reversal_data = json.loads(reversal_result[0].text)
-                assert reversal_data["success"] is True
-                assert reversal_data["data"]["originalTransactionId"] == transaction_id
+        # Verify the operation result
+        data = json.loads(result[0].text)
+        assert data["success"] is True
+        for field, value in expected.items():
+            assert data["data"][field] == value
     
-    @pytest.mark.asyncio
     async def test_error_recovery_scenarios(self, e2e_server, customer_user_context):
         """Test error recovery and resilience scenarios."""
-        auth_token = "Bearer customer.jwt.token"
+        auth_token = _CUSTOMER_TOKEN
+        account_client = e2e_server.account_client
+        transaction_client = e2e_server.transaction_client
+        e2e_server.auth_handler.extract_user_context.return_value = customer_user_context
         
-        with patch.object(e2e_server.auth_handler, 'extract_user_context') as mock_auth:
-            mock_auth.return_value = customer_user_context
-            
-            # Scenario 1: Service temporarily unavailable
-            with patch.object(e2e_server.account_client, 'get_account', new_callable=AsyncMock) as mock_get:
-                # First call fails, second succeeds (retry logic)
-                mock_get.side_effect = [
-                    Exception("Service temporarily unavailable"),
-                    {
-                        "id": "acc_recovery_123",
-                        "ownerId": "customer_123",
-                        "balance": 1000.0,
-                        "status": "ACTIVE"
-                    }
-                ]
-                
-                with patch('mcp_financial.tools.account_tools.PermissionChecker.can_access_account', return_value=True):
-                    # Should succeed on retry
-                    result = await e2e_server.account_tools.get_account("acc_recovery_123", auth_token)
-                
-                # Verify recovery
-                data = json.loads(result[0].text)
-                assert data["success"] is True
-                assert data["data"]["id"] == "acc_recovery_123"
-            
-            # Scenario 2: Network timeout with circuit breaker
-            with patch.object(e2e_server.transaction_client, 'get_transaction_history', new_callable=AsyncMock) as mock_history:
-                # Simulate timeout
-                mock_history.side_effect = asyncio.TimeoutError("Request timeout")
-                
-                with patch('mcp_financial.tools.query_tools.PermissionChecker.can_access_account', return_value=True):
-                    result = await e2e_server.query_tools.get_transaction_history(
-                        "acc_123", 0, 20, None, None, auth_token
-                    )
-                
-                # Should return error response
-                data = json.loads(result[0].text)
-                assert data["success"] is False
-                assert "timeout" in data["error_message"].lower()
+        # Scenario 1: Service temporarily unavailable
+        # The first connection attempt fails and the client's retry succeeds
+        with patch.object(account_client, '_sleep', new_callable=AsyncMock) as backoff_sleep, \
+             patch.object(account_client.client, 'request', side_effect=[
+                 httpx.ConnectError("Service temporarily unavailable"),
+                 _json_response(_RECOVERY_ACCOUNT)
+             ]) as account_request:
+            result = await _call_tool(
+                e2e_server, "get_account", account_id="acc_recovery_123", auth_token=auth_token
+            )
+        
+        assert account_request.call_count == 2
+        backoff_sleep.assert_awaited_once()
+        data = json.loads(result[0].text)
+        assert data["success"] is True
+        assert data["data"]["id"] == "acc_recovery_123"
+        
+        # Scenario 2: Network timeout on every attempt
+        with patch.object(account_client.client, 'request', return_value=_json_response(_RECOVERY_ACCOUNT)), \
+             patch.object(transaction_client, '_sleep', new_callable=AsyncMock), \
+             patch.object(transaction_client.client, 'request', side_effect=httpx.TimeoutException("Request timeout")) as history_request:
+            result = await _call_tool(
+                e2e_server, "get_transaction_history",
+                account_id="acc_recovery_123", page=0, size=20, auth_token=auth_token
+            )
+        
+        # Retried up to the configured limit, then reported back as an error
+        assert history_request.call_count == _E2E_SETTINGS.max_retries + 1
+        assert "timeout" in result[0].text.lower()
     
-    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mocked_backend")
     async def test_concurrent_operations_consistency(self, e2e_server, customer_user_context):
         """Test consistency under concurrent operations."""
-        auth_token = "Bearer customer.jwt.token"
+        auth_token = _CUSTOMER_TOKEN
         account_id = "acc_concurrent_123"
+        e2e_server.auth_handler.extract_user_context.return_value = customer_user_context
+        
+        # Mock account and balance checks
+        e2e_server.account_client.get_account.return_value = _CONCURRENT_ACCOUNT
+        
+        e2e_server.account_client.get_account_balance.return_value = _CONCURRENT_BALANCE
+        
+        # Mock successful deposits with unique IDs
+        e2e_server.transaction_client.deposit_funds.side_effect = [
+            {
+                "id": f"txn_concurrent_{i + 1}",
+                "accountId": account_id,
+                "amount": 100.0,
+                "transactionType": "DEPOSIT",
+                "status": "COMPLETED"
+            }
+            for i in range(5)
+        ]
         
-        with patch.object(e2e_server.auth_handler, 'extract_user_context') as mock_auth:
-            mock_auth.return_value = customer_user_context
-            
-            # Mock account and balance checks
-            with patch.object(e2e_server.account_client, 'get_account', new_callable=AsyncMock) as mock_get_account, \
-                 patch.object(e2e_server.account_client, 'get_account_balance', new_callable=AsyncMock) as mock_balance, \
-                 patch.object(e2e_server.transaction_client, 'deposit_funds', new_callable=AsyncMock) as mock_deposit:
-                
-                mock_get_account.return_value = {
-                    "id": account_id,
-                    "ownerId": "customer_123",
-                    "status": "ACTIVE"
-                }
-                
-                mock_balance.return_value = {
-                    "accountId": account_id,
-                    "balance": 1000.0,
-                    "availableBalance": 1000.0
-                }
-                
-                # Mock successful deposits with unique IDs
-                deposit_counter = 0
-                
-                async def mock_deposit_func(*args, **kwargs):
-                    nonlocal deposit_counter
-                    deposit_counter += 1
-                    return {
-                        "id": f"txn_concurrent_{deposit_counter}",
-                        "accountId": account_id,
-                        "amount": 100.0,
-                        "transactionType": "DEPOSIT",
-                        "status": "COMPLETED"
-                    }
-                
-                mock_deposit.side_effect = mock_deposit_func
-                
-                # Execute concurrent deposits
-                with patch('mcp_financial.tools.transaction_tools.PermissionChecker.can_access_account', return_value=True):
-                    tasks = []
-                    for i in range(5):
-                        task = e2e_server.transaction_tools.deposit_funds(
-                            account_id, 100.0, f"Concurrent deposit {i}", auth_token
-                        )
-                        tasks.append(task)
-                    
-                    results = await asyncio.gather(*tasks)
-                
-                # Verify all operations completed successfully
-                assert len(results) == 5
-                for result in results:
-                    data = json.loads(result[0].text)
-                    assert data["success"] is True
-                    assert data["data"]["amount"] == 100.0
-                
-                # Verify unique transaction IDs
-                transaction_ids = [json.loads(r[0].text)["data"]["id"] for r in results]
-                assert len(set(transaction_ids)) == 5, "Transaction IDs should be unique"
+        # Execute concurrent deposits
+        tasks = [
+            _call_tool(
+                e2e_server, "deposit_funds",
+                account_id=account_id, amount=100.0, description=f"Concurrent deposit {i}", auth_token=auth_token
+            )
+            for i in range(5)
+        ]
+        
+        results = await asyncio.gather(*tasks)
+        
+        # Verify all operations completed successfully
+        assert len(results) == 5
+        payloads = [json.loads(result[0].text) for result in results]
+        for data in payloads:
+            assert data["success"] is True
+            assert data["data"]["amount"] == 100.0
+        
+        # Verify unique transaction IDs
+        transaction_ids = [data["data"]["id"] for data in payloads]
+        assert len(set(transaction_ids)) == 5, "Transaction IDs should be unique"
     
-    @pytest.mark.asyncio
-    async def test_audit_trail_completeness(self, e2e_server, financial_officer_context):
-        """Test that all operations create proper audit trails."""
-        auth_token = "Bearer officer.jwt.token"
+    @pytest.mark.usefixtures("mocked_backend")
+    async def test_audit_trail_completeness(self, e2e_server, financial_officer_context, caplog):
+        """Test that a transaction reversal leaves a complete audit record."""
+        auth_token = _OFFICER_TOKEN
+        transaction_client = e2e_server.transaction_client
+        e2e_server.auth_handler.extract_user_context.return_value = financial_officer_context
+        transaction_client.get_transaction.return_value = _AUDITED_TRANSACTION
+        transaction_client.reverse_transaction.return_value = _AUDIT_REVERSAL
+        
+        with caplog.at_level(logging.INFO, logger="mcp_financial.tools.transaction_tools"):
+            result = await _call_tool(
+                e2e_server, "reverse_transaction",
+                transaction_id="txn_audit_456", reason="Duplicate charge", auth_token=auth_token
+            )
+        
+        data = json.loads(result[0].text)
+        assert data["success"] is True
         
-        with patch.object(e2e_server.auth_handler, 'extract_user_context') as mock_auth:
-            mock_auth.return_value = financial_officer_context
-            
-            # Track audit events
-            audit_events = []
-            
-            def capture_audit_event(event_type, user_id, resource_id, action, details=None):
-                audit_events.append({
-                    "event_type": event_type,
-                    "user_id": user_id,
-                    "resource_id": resource_id,
-                    "action": action,
-                    "details": details,
-                    "timestamp": datetime.utcnow().isoformat()
-                })
-            
-            # Mock audit logging
-            with patch('mcp_financial.utils.logging.log_audit_event', side_effect=capture_audit_event):
-                
-                # Perform various operations
-                operations = [
-                    ("create_account", "customer_789", "SAVINGS", 500.0),
-                    ("deposit_funds", "acc_audit_123", 250.0, "Audit test deposit"),
-                    ("update_account_balance", "acc_audit_123", 1000.0, "Balance correction")
-                ]
-                
-                for operation in operations:
-                    if operation[0] == "create_account":
-                        with patch.object(e2e_server.account_client, 'create_account', new_callable=AsyncMock) as mock_create:
-                            mock_create.return_value = {
-                                "id": "acc_audit_123",
-                                "ownerId": operation[1],
-                                "accountType": operation[2],
-                                "balance": operation[3]
-                            }
-                            
-                            with patch('mcp_financial.tools.account_tools.PermissionChecker.can_create_account', return_value=True):
-                                await e2e_server.account_tools.create_account(
-                                    operation[1], operation[2], operation[3], auth_token
-                                )
-                    
-                    elif operation[0] == "deposit_funds":
-                        with patch.object(e2e_server.account_client, 'get_account', new_callable=AsyncMock) as mock_get, \
-                             patch.object(e2e_server.transaction_client, 'deposit_funds', new_callable=AsyncMock) as mock_deposit:
-                            
-                            mock_get.return_value = {"id": operation[1], "ownerId": "customer_789", "status": "ACTIVE"}
-                            mock_deposit.return_value = {
-                                "id": "txn_audit_456",
-                                "accountId": operation[1],
-                                "amount": operation[2],
-                                "transactionType": "DEPOSIT"
-                            }
-                            
-                            with patch('mcp_financial.tools.transaction_tools.PermissionChecker.can_access_account', return_value=True):
-                                await e2e_server.transaction_tools.deposit_funds(
-                                    operation[1], operation[2], operation[3], auth_token
-                                )
-                    
-                    elif operation[0] == "update_account_balance":
-                        with patch.object(e2e_server.account_client, 'update_account_balance', new_callable=AsyncMock) as mock_update:
-                            mock_update.return_value = {
-                                "accountId": operation[1],
-                                "balance": operation[2],
-                                "reason": operation[3]
-                            }
-                            
-                            with patch('mcp_financial.tools.account_tools.PermissionChecker.has_permission', return_value=True):
-                                await e2e_server.account_tools.update_account_balance(
-                                    operation[1], operation[2], operation[3], auth_token
-                                )
-                
-                # Verify audit trail completeness
-                assert len(audit_events) >= len(operations), "Missing audit events"
-                
-                # Verify audit event structure
-                for event in audit_events:
-                    assert "event_type" in event
-                    assert "user_id" in event
-                    assert "resource_id" in event
-                    assert "action" in event
-                    assert "timestamp" in event
-                    assert event["user_id"] == financial_officer_context.user_id
\ No newline at end of file
+        # The reversal is logged once with who did it, what was reversed and why
+        audit_records = [record for record in caplog.records if record.getMessage() == "Transaction reversed"]
+        assert len(audit_records) == 1
+        record = audit_records[0]
+        assert record.user_id == financial_officer_context.user_id
+        assert record.original_transaction_id == "txn_audit_456"
+        assert record.reversal_transaction_id == "txn_audit_reversal_789"
+        assert record.reason == "Duplicate charge"
+        assert record.original_amount == 250.0
+        assert record.request_id == data["request_id"]
@@ -3,248 +3,264 @@ Integration tests for error handling scenarios.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+import json
 import httpx
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import patch, AsyncMock, call
 from decimal import Decimal
 
-from src.mcp_financial.clients.base_client import BaseHTTPClient, CircuitBreakerError
+from src.mcp_financial.clients.base_client import BaseHTTPClient, BreakerState, CircuitBreakerError
 from src.mcp_financial.clients.account_client import AccountServiceClient
 from src.mcp_financial.exceptions.base import (
     ValidationError,
     AuthenticationError,
+    BusinessRuleError,
     ServiceError,
     TimeoutError
 )
+from src.mcp_financial.exceptions.handlers import create_error_response
 
 
+@pytest.fixture(scope="module")
+def transport_router():
+    """Map request paths to handler callables served by the mock transport."""
+    return {}
+
+
+def _routed_transport(router):
+    """Build a MockTransport that dispatches each request to router[path]."""
+    return httpx.MockTransport(lambda request: router[request.url.path](request))
+
+
+class _FakeClock:
+    """Manually advanced monotonic ns clock injected as a breaker time_source."""
+    
+    def __init__(self):
+        self.now = 0
+        
+    def __call__(self) -> int:
+        return self.now
+
+
+# Responses returned from a patched client.request need a request for raise_for_status
+_TEST_REQUEST = httpx.Request("GET", "http://test-service:8080/test")
+
+
+async def _no_sleep(delay: float) -> None:
+    """Retry backoff that returns immediately."""
+
+
+def _raise(exc):
+    """Handler that fails the request with the given transport error."""
+    def handler(request):
+        raise exc
+    return handler
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def http_client(transport_router):
+    """Create one HTTP client, with no-op retry backoff, for the module."""
+    client = BaseHTTPClient(
+        "http://test-service:8080",
+        max_retries=3,
+        transport=_routed_transport(transport_router),
+        sleep=_no_sleep
+    )
+    yield client
+    await client.close()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def account_service_client(transport_router):
+    """Create one account service client for the module."""
+    client = AccountServiceClient("http://account-service:8080", transport=_routed_transport(transport_router))
+    yield client
+    await client.close()
+
+
+@pytest.fixture(scope="module")
+def breaker_clock():
+    """Virtual clock shared by the module's circuit breaker client."""
+    return _FakeClock()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def breaker_client(transport_router, breaker_clock):
+    """Create one HTTP client with a low failure threshold, and no retries, for the module."""
+    client = BaseHTTPClient(
+        "http://test-service:8080",
+        max_retries=0,
+        circuit_breaker_failure_threshold=2,
+        circuit_breaker_recovery_timeout=1,
+        transport=_routed_transport(transport_router),
+        time_source=breaker_clock
+    )
+    yield client
+    await client.close()
+
+
+@pytest.mark.xdist_group("http_client_errors")
 class TestBaseHTTPClientErrorHandling:
     """Test error handling in base HTTP client."""
     
     @pytest.fixture
-    async def client(self):
-        """Create test HTTP client."""
-        client = BaseHTTPClient("http://test-service:8080")
-        yield client
-        await client.close()
-        
-    @pytest.mark.asyncio
-    async def test_timeout_error_handling(self, client):
+    def client(self, http_client):
+        """Provide the shared HTTP client with its breaker reset."""
+        http_client.circuit_breaker.reset()
+        return http_client
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_timeout_error_handling(self, client, transport_router):
         """Test timeout error handling."""
-        with patch.object(client.client, 'request') as mock_request:
-            mock_request.side_effect = httpx.TimeoutException("Request timeout")
+        transport_router["/test"] = _raise(httpx.TimeoutException("Request timeout"))
+        
+        with pytest.raises(TimeoutError) as exc_info:
+            await client.get("/test")
             
-            with pytest.raises(TimeoutError) as exc_info:
-                await client.get("/test")
-                
-            error = exc_info.value
-            assert error.error_code == "TIMEOUT_ERROR"
-            assert "timeout" in error.message.lower()
-            assert error.timeout_seconds == client.timeout
+        error = exc_info.value
+        assert error.error_code == "TIMEOUT_ERROR"
+        assert "timeout" in error.message.lower()
+        assert error.timeout_seconds == client.timeout
             
-    @pytest.mark.asyncio
-    async def test_connection_error_handling(self, client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_connection_error_handling(self, client, transport_router):
         """Test connection error handling."""
-        with patch.object(client.client, 'request') as mock_request:
-            mock_request.side_effect = httpx.ConnectError("Connection failed")
-            
-            with pytest.raises(ServiceError) as exc_info:
-                await client.get("/test")
-                
-            error = exc_info.value
-            assert error.error_code == "SERVICE_ERROR"
-            assert "connection error" in error.message.lower()
-            
-    @pytest.mark.asyncio
-    async def test_http_400_error_handling(self, client):
-        """Test HTTP 400 error handling."""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {"message": "Invalid request"}
-        
-        with patch.object(client.client, 'request') as mock_request:
-            mock_request.return_value = mock_response
-            
-            with pytest.raises(ValidationError) as exc_info:
-                await client.get("/test")
-                
-            error = exc_info.value
-            assert error.error_code == "VALIDATION_ERROR"
-            assert "bad request" in error.message.lower()
-            
-    @pytest.mark.asyncio
-    async def test_http_401_error_handling(self, client):
-        """Test HTTP 401 error handling."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.json.return_value = {"error": "Unauthorized"}
-        
-        with patch.object(client.client, 'request') as mock_request:
-            mock_request.return_value = mock_response
+        transport_router["/test"] = _raise(httpx.ConnectError("Connection failed"))
+        
+        with pytest.raises(ServiceError) as exc_info:
+            await client.get("/test")
             
-            with pytest.raises(AuthenticationError) as exc_info:
-                await client.get("/test")
-                
-            error = exc_info.value
-            assert error.error_code == "AUTHENTICATION_ERROR"
+        error = exc_info.value
+        assert error.error_code == "SERVICE_ERROR"
+        assert "connection error" in error.message.lower()
             
-    @pytest.mark.asyncio
-    async def test_http_500_error_handling(self, client):
-        """Test HTTP 500 error handling."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.json.return_value = {"error": "Internal server error"}
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Server error", request=Mock(), response=mock_response
-        )
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("status,body,exc,code,fragment", [
+        (400, {"message": "Invalid request"}, ValidationError, "VALIDATION_ERROR", "bad request"),
+        (401, {"error": "Unauthorized"}, AuthenticationError, "AUTHENTICATION_ERROR", "authentication failed"),
+        (500, {"error": "Internal server error"}, ServiceError, "SERVICE_ERROR", "server error"),
+    ], ids=["http-400", "http-401", "http-500"])
+    async def test_http_status_error_handling(self, client, transport_router, status, body, exc, code, fragment):
+        """Test HTTP error statuses map to the matching MCP error."""
+        transport_router["/test"] = lambda r: httpx.Response(status, json=body)
         
-        with patch.object(client.client, 'request') as mock_request:
-            mock_request.return_value = mock_response
+        with pytest.raises(exc) as exc_info:
+            await client.get("/test")
             
-            with pytest.raises(ServiceError) as exc_info:
-                await client.get("/test")
-                
-            error = exc_info.value
-            assert error.error_code == "SERVICE_ERROR"
-            assert error.status_code == 500
+        error = exc_info.value
+        assert error.error_code == code
+        assert fragment in error.message.lower()
+        if isinstance(error, ServiceError):
+            assert error.status_code == status
 
 
+@pytest.mark.xdist_group("breaker_integration")
 class TestCircuitBreakerIntegration:
     """Test circuit breaker integration with HTTP client."""
     
     @pytest.fixture
-    async def client(self):
-        """Create test HTTP client with low failure threshold."""
-        client = BaseHTTPClient(
-            "http://test-service:8080",
-            circuit_breaker_failure_threshold=2,
-            circuit_breaker_recovery_timeout=1
-        )
-        yield client
-        await client.close()
+    def clock(self, breaker_clock):
+        """Virtual clock driving the shared client's circuit breaker."""
+        return breaker_clock
+        
+    @pytest.fixture
+    def client(self, breaker_client):
+        """Provide the shared low-threshold client with its breaker reset."""
+        breaker_client.circuit_breaker.reset()
+        return breaker_client
         
-    @pytest.mark.asyncio
-    async def test_circuit_breaker_opens_on_failures(self, client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_circuit_breaker_opens_on_failures(self, client, transport_router):
         """Test circuit breaker opens after consecutive failures."""
-        with patch.object(client.client, 'request') as mock_request:
-            mock_request.side_effect = httpx.ConnectError("Connection failed")
-            
-            # First failure
-            with pytest.raises(ServiceError):
-                await client.get("/test")
-            assert client.circuit_breaker.state == "CLOSED"
-            
-            # Second failure should open circuit
-            with pytest.raises(ServiceError):
-                await client.get("/test")
-            assert client.circuit_breaker.state == "OPEN"
-            
-            # Third call should raise CircuitBreakerError
-            with pytest.raises(CircuitBreakerError):
-                await client.get("/test")
+        transport_router["/test"] = _raise(httpx.ConnectError("Connection failed"))
+        
+        # First failure
+        with pytest.raises(ServiceError):
+            await client.get("/test")
+        assert client.circuit_breaker.state is BreakerState.CLOSED
+        
+        # Second failure should open circuit
+        with pytest.raises(ServiceError):
+            await client.get("/test")
+        assert client.circuit_breaker.state is BreakerState.OPEN
+        
+        # Third call should raise CircuitBreakerError
+        with pytest.raises(CircuitBreakerError):
+            await client.get("/test")
                 
-    @pytest.mark.asyncio
-    async def test_circuit_breaker_recovery(self, client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_circuit_breaker_recovery(self, client, transport_router, clock):
         """Test circuit breaker recovery after timeout."""
-        with patch.object(client.client, 'request') as mock_request:
-            # Cause failures to open circuit
-            mock_request.side_effect = httpx.ConnectError("Connection failed")
-            
-            with pytest.raises(ServiceError):
-                await client.get("/test")
-            with pytest.raises(ServiceError):
-                await client.get("/test")
-            assert client.circuit_breaker.state == "OPEN"
-            
-            # Wait for recovery timeout
-            await asyncio.sleep(1.1)
-            
-            # Mock successful response
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"status": "ok"}
-            mock_response.raise_for_status.return_value = None
-            mock_request.side_effect = None
-            mock_request.return_value = mock_response
-            
-            # Should transition to half-open and then closed
-            result = await client.get("/test")
-            assert result == {"status": "ok"}
-            assert client.circuit_breaker.state in ["HALF_OPEN", "CLOSED"]
+        # Cause failures to open circuit
+        transport_router["/test"] = _raise(httpx.ConnectError("Connection failed"))
+        
+        with pytest.raises(ServiceError):
+            await client.get("/test")
+        with pytest.raises(ServiceError):
+            await client.get("/test")
+        assert client.circuit_breaker.state is BreakerState.OPEN
+        
+        # Advance past the recovery timeout
+        clock.now += 1_100_000_000
+        
+        # Serve a successful response
+        transport_router["/test"] = lambda r: httpx.Response(200, json={"status": "ok"})
+        
+        # The first success is a half-open probe; the circuit closes after three
+        result = await client.get("/test")
+        assert result == {"status": "ok"}
+        assert client.circuit_breaker.state is BreakerState.HALF_OPEN
+        
+        for _ in range(2):
+            await client.get("/test")
+        assert client.circuit_breaker.state is BreakerState.CLOSED
 
 
+@pytest.mark.xdist_group("account_client_errors")
 class TestAccountServiceClientErrorHandling:
     """Test error handling in account service client."""
     
     @pytest.fixture
-    async def account_client(self):
-        """Create test account service client."""
-        client = AccountServiceClient("http://account-service:8080")
-        yield client
-        await client.close()
-        
-    @pytest.mark.asyncio
-    async def test_get_account_not_found(self, account_client):
-        """Test get account with 404 error."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.json.return_value = {"error": "Account not found"}
-        
-        with patch.object(account_client.client, 'request') as mock_request:
-            mock_request.return_value = mock_response
-            
-            with pytest.raises(ValidationError) as exc_info:
-                await account_client.get_account("nonexistent", "token")
-                
-            error = exc_info.value
-            assert "not found" in error.message.lower()
-            
-    @pytest.mark.asyncio
-    async def test_create_account_validation_error(self, account_client):
-        """Test create account with validation error."""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {
-            "message": "Validation failed",
-            "errors": [
-                {"field": "accountType", "message": "Invalid account type"}
-            ]
-        }
-        
-        with patch.object(account_client.client, 'request') as mock_request:
-            mock_request.return_value = mock_response
-            
-            account_data = {
-                "ownerId": "user123",
-                "accountType": "INVALID",
-                "balance": 100.0
-            }
-            
-            with pytest.raises(ValidationError) as exc_info:
-                await account_client.create_account(account_data, "token")
-                
-            error = exc_info.value
-            assert "bad request" in error.message.lower()
-            
-    @pytest.mark.asyncio
-    async def test_update_balance_insufficient_funds(self, account_client):
-        """Test update balance with insufficient funds."""
-        mock_response = Mock()
-        mock_response.status_code = 409
-        mock_response.json.return_value = {"message": "Insufficient funds"}
-        
-        with patch.object(account_client.client, 'request') as mock_request:
-            mock_request.return_value = mock_response
+    def account_client(self, account_service_client):
+        """Provide the shared account service client with its breaker reset."""
+        account_service_client.circuit_breaker.reset()
+        return account_service_client
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("call,path,status,body,exc,fragment", [
+        (
+            lambda c: c.get_account("nonexistent", "token"),
+            "/api/accounts/nonexistent", 404, {"error": "Account not found"},
+            ValidationError, "not found"
+        ),
+        (
+            lambda c: c.create_account({"ownerId": "user123", "accountType": "INVALID", "balance": 100.0}, "token"),
+            "/api/accounts", 400,
+            {"message": "Validation failed", "errors": [{"field": "accountType", "message": "Invalid account type"}]},
+            ValidationError, "bad request"
+        ),
+        (
+            lambda c: c.update_balance("acc123", Decimal("-1000"), "token"),
+            "/api/accounts/acc123", 409, {"message": "Insufficient funds"},
+            BusinessRuleError, "insufficient funds"
+        ),
+    ], ids=["get-account-not-found", "create-account-validation", "update-balance-insufficient-funds"])
+    async def test_account_error_handling(self, account_client, transport_router, call, path, status, body, exc, fragment):
+        """Test account service error responses surface as MCP errors."""
+        transport_router[path] = lambda r: httpx.Response(status, json=body)
+        
+        with pytest.raises(exc) as exc_info:
+            await call(account_client)
             
-            with pytest.raises(Exception):  # Should be BusinessRuleError
-                await account_client.update_balance("acc123", Decimal("-1000"), "token")
+        assert fragment in str(exc_info.value).lower()
 
 
 class TestErrorPropagation:
     """Test error propagation through the system."""
     
-    @pytest.mark.asyncio
-    async def test_error_propagation_from_client_to_tool(self):
+    @pytest.mark.skip(reason="Not implemented: needs MCP tool integration")
+    def test_error_propagation_from_client_to_tool(self):
         """Test error propagation from HTTP client to MCP tool."""
         # This would test the full error flow from HTTP client through
         # service client to MCP tool and back to user
@@ -261,11 +277,9 @@ class TestErrorPropagation:
         # This would be implemented with actual MCP tool integration
         pass
         
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_validation_error_formatting(self):
         """Test validation error formatting for MCP responses."""
-        from src.mcp_financial.exceptions.handlers import create_error_response
-        
         error = ValidationError(
             "Invalid account type",
             field="account_type",
@@ -278,7 +292,6 @@ class TestErrorPropagation:
         assert response[0].type == "text"
         
         # Parse the JSON response
-        import json
         response_data = json.loads(response[0].text)
         
         assert response_data["error_code"] == "VALIDATION_ERROR"
@@ -290,84 +303,114 @@ class TestRetryMechanisms:
     """Test retry mechanisms in error scenarios."""
     
     @pytest.fixture
-    async def client(self):
-        """Create test HTTP client."""
-        client = BaseHTTPClient("http://test-service:8080", max_retries=3)
-        yield client
-        await client.close()
-        
-    @pytest.mark.asyncio
-    async def test_retry_on_timeout(self, client):
+    def client(self, http_client):
+        """Provide the shared HTTP client with its breaker reset."""
+        http_client.circuit_breaker.reset()
+        return http_client
+        
+    @pytest.fixture
+    def backoff_sleep(self, client):
+        """Record the client's backoff sleeps instead of waiting."""
+        with patch.object(client, '_sleep', new_callable=AsyncMock) as mock_sleep:
+            yield mock_sleep
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_retry_on_timeout(self, client, backoff_sleep):
         """Test retry mechanism on timeout errors."""
-        call_count = 0
-        
-        def mock_request(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count < 3:
-                raise httpx.TimeoutException("Timeout")
-            else:
-                # Success on third try
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.json.return_value = {"status": "ok"}
-                mock_response.raise_for_status.return_value = None
-                return mock_response
-                
-        with patch.object(client.client, 'request', side_effect=mock_request):
+        responses = [
+            httpx.TimeoutException("Timeout"),
+            httpx.TimeoutException("Timeout"),
+            # Success on third try
+            httpx.Response(200, json={"status": "ok"}, request=_TEST_REQUEST),
+        ]
+        
+        with patch.object(client.client, 'request', side_effect=responses) as mock_request:
             result = await client.get("/test")
             assert result == {"status": "ok"}
-            assert call_count == 3
+            assert mock_request.call_count == 3
             
-    @pytest.mark.asyncio
-    async def test_no_retry_on_client_errors(self, client):
-        """Test that client errors (4xx) are not retried."""
-        call_count = 0
-        
-        def mock_request(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            mock_response = Mock()
-            mock_response.status_code = 400
-            mock_response.json.return_value = {"error": "Bad request"}
-            return mock_response
+        # Exponential backoff from retry_delay (1s) between the attempts
+        assert backoff_sleep.await_args_list == [call(1.0), call(2.0)]
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_retry_exhausted_on_connection_error(self, client, backoff_sleep):
+        """Test connection errors are retried max_retries times, then surface."""
+        with patch.object(client.client, 'request', side_effect=httpx.ConnectError("Connection failed")) as mock_request:
+            with pytest.raises(ServiceError) as exc_info:
+                await client.get("/test")
+            assert mock_request.call_count == client.max_retries + 1
+            
+        assert "connection error" in exc_info.value.message.lower()
+        assert backoff_sleep.await_args_list == [call(1.0), call(2.0), call(4.0)]
+            
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_no_retry_on_post_timeout(self, client, backoff_sleep):
+        """Test a timed-out POST is not re-sent: the service may already have applied it."""
+        with patch.object(client.client, 'request', side_effect=httpx.ReadTimeout("Timeout")) as mock_request:
+            with pytest.raises(TimeoutError):
+                await client.post("/api/transactions/deposit", data={"amount": 100.0})
+            assert mock_request.call_count == 1
+            
+        backoff_sleep.assert_not_awaited()
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_retry_post_on_connect_failure(self, client, backoff_sleep):
+        """Test a POST that never reached the service is retried."""
+        responses = [
+            httpx.ConnectTimeout("Connect timeout"),
+            httpx.ConnectError("Connection failed"),
+            httpx.Response(201, json={"transactionId": "txn_123"}, request=_TEST_REQUEST),
+        ]
+        
+        with patch.object(client.client, 'request', side_effect=responses) as mock_request:
+            result = await client.post("/api/transactions/deposit", data={"amount": 100.0})
+            assert result == {"transactionId": "txn_123"}
+            assert mock_request.call_count == 3
             
-        with patch.object(client.client, 'request', side_effect=mock_request):
-            with pytest.raises(ValidationError):
+        assert backoff_sleep.await_args_list == [call(1.0), call(2.0)]
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("status,exc", [
+        (400, ValidationError),
+        (500, ServiceError),
+    ], ids=["http-400", "http-500"])
+    async def test_no_retry_on_http_errors(self, client, backoff_sleep, status, exc):
+        """Test that error responses (4xx and 5xx) are not retried."""
+        response = httpx.Response(status, json={"error": "Request failed"}, request=_TEST_REQUEST)
+        
+        with patch.object(client.client, 'request', return_value=response) as mock_request:
+            with pytest.raises(exc):
                 await client.get("/test")
-            # Should only be called once (no retry for 4xx errors)
-            assert call_count == 1
+            # Should only be called once (no retry for error responses)
+            assert mock_request.call_count == 1
+            
+        backoff_sleep.assert_not_awaited()
 
 
 class TestConcurrentErrorHandling:
     """Test error handling under concurrent load."""
     
-    @pytest.mark.asyncio
-    async def test_concurrent_circuit_breaker_behavior(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_concurrent_circuit_breaker_behavior(self, breaker_client, transport_router):
         """Test circuit breaker behavior under concurrent requests."""
-        client = BaseHTTPClient(
-            "http://test-service:8080",
-            circuit_breaker_failure_threshold=2
-        )
+        client = breaker_client
+        client.circuit_breaker.reset()
+        transport_router["/test"] = _raise(httpx.ConnectError("Connection failed"))
         
         async def failing_request():
-            with patch.object(client.client, 'request') as mock_request:
-                mock_request.side_effect = httpx.ConnectError("Connection failed")
-                try:
-                    await client.get("/test")
-                except (ServiceError, CircuitBreakerError):
-                    pass
+            try:
+                await client.get("/test")
+            except (ServiceError, CircuitBreakerError):
+                pass
                     
-        # Run multiple concurrent requests
-        tasks = [failing_request() for _ in range(5)]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Run multiple concurrent requests; failing_request swallows the expected errors,
+        # so anything else propagates out of gather
+        await asyncio.gather(*(failing_request() for _ in range(5)))
         
         # Circuit should be open after failures
-        assert client.circuit_breaker.state == "OPEN"
-        
-        await client.close()
+        assert client.circuit_breaker.state is BreakerState.OPEN
         
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_error_isolation_between_clients(self):
         """Test that errors in one client don't affect others."""
         client1 = BaseHTTPClient("http://service1:8080", circuit_breaker_failure_threshold=1)
@@ -381,19 +424,17 @@ class TestConcurrentErrorHandling:
                 await client1.get("/test")
                 
         # Client1 circuit should be open
-        assert client1.circuit_breaker.state == "OPEN"
+        assert client1.circuit_breaker.state is BreakerState.OPEN
         
         # Client2 should still work
         with patch.object(client2.client, 'request') as mock_request2:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"status": "ok"}
-            mock_response.raise_for_status.return_value = None
-            mock_request2.return_value = mock_response
+            mock_request2.return_value = httpx.Response(
+                200, json={"status": "ok"}, request=httpx.Request("GET", "http://service2:8080/test")
+            )
             
             result = await client2.get("/test")
             assert result == {"status": "ok"}
-            assert client2.circuit_breaker.state == "CLOSED"
+            assert client2.circuit_breaker.state is BreakerState.CLOSED
             
         await client1.close()
         await client2.close()
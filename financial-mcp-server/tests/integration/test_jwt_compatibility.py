@@ -2,26 +2,64 @@
 Integration tests for JWT compatibility with existing services.
 """
 
+import time
+
 import pytest
 from datetime import datetime, timedelta
 
-from mcp_financial.auth.jwt_handler import JWTAuthHandler
+from mcp_financial.auth.jwt_handler import JWTAuthHandler, AuthenticationError
 from mcp_financial.auth.permissions import PermissionChecker, Permission
 
 
+class _FakeClock:
+    """Manually advanced clock injected as a handler time_source."""
+    
+    def __init__(self, now: float):
+        self.now = now
+        
+    def __call__(self) -> float:
+        return self.now
+
+
+# role -> (user_id, username) for the single-role tokens shared across tests
+_ROLE_USERS = {
+    "admin": ("admin_001", "admin"),
+    "financial_officer": ("fo_001", "financial.officer"),
+    "customer": ("cust_001", "customer"),
+    "account_manager": ("am_001", "account.manager"),
+    "customer_service": ("cs_001", "customer.service"),
+    "readonly_user": ("ro_001", "readonly.user"),
+}
+
+
+@pytest.mark.xdist_group("jwt_compat")
 class TestJWTCompatibility:
     """Test JWT compatibility with existing financial services."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def jwt_secret(self):
         """JWT secret key used by existing services."""
         return "AY8Ro0HSBFyllm9ZPafT2GWuE/t8Yzq1P0Rf7bNeq14="
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def auth_handler(self, jwt_secret):
         """Create JWT auth handler with production secret."""
         return JWTAuthHandler(jwt_secret)
     
+    @pytest.fixture(scope="session")
+    def role_tokens(self, auth_handler):
+        """Sign one token per role, once for the whole session."""
+        return {
+            role: auth_handler.create_token(
+                user_id=user_id,
+                username=username,
+                roles=[role],
+                permissions=[],
+                expires_in=3600
+            )
+            for role, (user_id, username) in _ROLE_USERS.items()
+        }
+    
     def test_jwt_token_compatibility(self, auth_handler):
         """Test that JWT tokens are compatible with existing services."""
         # Create a token similar to what the existing services would create
@@ -66,18 +104,10 @@ class TestJWTCompatibility:
         assert user_context.has_permission("account:create")
         assert user_context.has_permission("transaction:create")
     
-    def test_permission_checking_with_realistic_roles(self, auth_handler):
+    def test_permission_checking_with_realistic_roles(self, auth_handler, role_tokens):
         """Test permission checking with realistic role scenarios."""
         # Test admin user
-        admin_token = auth_handler.create_token(
-            user_id="admin_001",
-            username="admin",
-            roles=["admin"],
-            permissions=[],
-            expires_in=3600
-        )
-        
-        admin_context = auth_handler.extract_user_context(admin_token)
+        admin_context = auth_handler.extract_user_context(role_tokens["admin"])
         
         # Admin should have all permissions
         assert PermissionChecker.has_permission(admin_context, Permission.ACCOUNT_CREATE)
@@ -87,15 +117,7 @@ class TestJWTCompatibility:
         assert PermissionChecker.can_reverse_transaction(admin_context)
         
         # Test financial officer
-        fo_token = auth_handler.create_token(
-            user_id="fo_001",
-            username="financial.officer",
-            roles=["financial_officer"],
-            permissions=[],
-            expires_in=3600
-        )
-        
-        fo_context = auth_handler.extract_user_context(fo_token)
+        fo_context = auth_handler.extract_user_context(role_tokens["financial_officer"])
         
         # Financial officer should have financial permissions but not admin
         assert PermissionChecker.has_permission(fo_context, Permission.ACCOUNT_CREATE)
@@ -105,15 +127,7 @@ class TestJWTCompatibility:
         assert PermissionChecker.can_reverse_transaction(fo_context)
         
         # Test customer
-        customer_token = auth_handler.create_token(
-            user_id="cust_001",
-            username="customer",
-            roles=["customer"],
-            permissions=[],
-            expires_in=3600
-        )
-        
-        customer_context = auth_handler.extract_user_context(customer_token)
+        customer_context = auth_handler.extract_user_context(role_tokens["customer"])
         
         # Customer should have limited permissions
         assert PermissionChecker.has_permission(customer_context, Permission.ACCOUNT_READ)
@@ -150,8 +164,11 @@ class TestJWTCompatibility:
         # Claims should be identical
         assert claims == claims_direct
     
-    def test_token_expiration_handling(self, auth_handler):
+    def test_token_expiration_handling(self, jwt_secret):
         """Test token expiration handling."""
+        clock = _FakeClock(time.time())
+        auth_handler = JWTAuthHandler(jwt_secret, time_source=clock)
+        
         # Create a short-lived token
         token = auth_handler.create_token(
             user_id="test_user",
@@ -165,19 +182,15 @@ class TestJWTCompatibility:
         claims = auth_handler.validate_token(token)
         assert claims['sub'] == 'test_user'
         
-        # Wait for token to expire (in real test, we'd mock time)
-        import time
-        time.sleep(2)
+        # Advance the clock past expiry
+        clock.now += 2
         
         # Token should now be expired
-        from mcp_financial.auth.jwt_handler import AuthenticationError
         with pytest.raises(AuthenticationError, match="Token has expired"):
             auth_handler.validate_token(token)
     
     def test_invalid_token_handling(self, auth_handler):
         """Test handling of invalid tokens."""
-        from mcp_financial.auth.jwt_handler import AuthenticationError
-        
         # Test completely invalid token
         with pytest.raises(AuthenticationError, match="Invalid token"):
             auth_handler.validate_token("invalid.token.format")
@@ -189,33 +202,17 @@ class TestJWTCompatibility:
         with pytest.raises(AuthenticationError, match="Invalid token"):
             wrong_secret_handler.validate_token(valid_token)
     
-    def test_role_based_access_scenarios(self, auth_handler):
+    def test_role_based_access_scenarios(self, auth_handler, role_tokens):
         """Test realistic role-based access scenarios."""
         # Scenario 1: Account Manager creating account for customer
-        am_token = auth_handler.create_token(
-            user_id="am_001",
-            username="account.manager",
-            roles=["account_manager"],
-            permissions=[],
-            expires_in=3600
-        )
-        
-        am_context = auth_handler.extract_user_context(am_token)
+        am_context = auth_handler.extract_user_context(role_tokens["account_manager"])
         
         # Account manager can create accounts and read account data
         assert PermissionChecker.can_create_account(am_context, "customer_123")
         assert PermissionChecker.can_access_account(am_context, "customer_123")
         
         # Scenario 2: Customer Service accessing customer data
-        cs_token = auth_handler.create_token(
-            user_id="cs_001",
-            username="customer.service",
-            roles=["customer_service"],
-            permissions=[],
-            expires_in=3600
-        )
-        
-        cs_context = auth_handler.extract_user_context(cs_token)
+        cs_context = auth_handler.extract_user_context(role_tokens["customer_service"])
         
         # Customer service can read accounts and transactions but not create
         assert not PermissionChecker.can_create_account(cs_context, "customer_123")
@@ -223,15 +220,7 @@ class TestJWTCompatibility:
         assert PermissionChecker.has_permission(cs_context, Permission.TRANSACTION_READ)
         
         # Scenario 3: Read-only user accessing data
-        ro_token = auth_handler.create_token(
-            user_id="ro_001",
-            username="readonly.user",
-            roles=["readonly_user"],
-            permissions=[],
-            expires_in=3600
-        )
-        
-        ro_context = auth_handler.extract_user_context(ro_token)
+        ro_context = auth_handler.extract_user_context(role_tokens["readonly_user"])
         
         # Read-only user can only read, no write operations
         assert not PermissionChecker.can_create_account(ro_context, "customer_123")
@@ -0,0 +1,32 @@
+"""
+Alerting integration tests.
+"""
+
+from mcp_financial.utils.alerting import MonitoringAlerts
+
+
+class TestMonitoringAlerting:
+    """Test alerting integration."""
+    
+    async def test_alerting_integration(self, alert_manager, monitoring_tools):
+        """Alerts raised by the monitoring helpers are suppressed, counted and listed by get_alerts."""
+        assert await MonitoringAlerts.service_down_alert("account-service", "Connection refused")
+        assert await MonitoringAlerts.circuit_breaker_alert("transaction-service", "OPEN")
+        assert await MonitoringAlerts.high_response_time_alert("account-service", 1200.0)
+        
+        # A repeat inside the service_down suppression window is dropped
+        assert await MonitoringAlerts.service_down_alert("account-service", "Connection refused") == ""
+        
+        stats = alert_manager.get_alert_stats()
+        assert stats["active_alerts"] == 3
+        assert stats["alerts_by_severity_24h"] == {"critical": 2, "warning": 1}
+        
+        get_alerts = monitoring_tools.get_tool_functions()["get_alerts"]
+        result = await get_alerts(active_only=True)
+        
+        alerts_text = result[0].text
+        assert alerts_text.startswith("Active Alerts (3):")
+        assert "Service Down: account-service" in alerts_text
+        assert "Circuit Breaker OPEN: transaction-service" in alerts_text
+        assert "High Response Time: account-service" in alerts_text
+        assert alerts_text.count("Severity: critical") == 2
@@ -0,0 +1,42 @@
+"""
+Monitoring automation integration tests.
+"""
+
+import asyncio
+import logging
+from unittest.mock import patch
+
+from tests.integration.monitoring_helpers import overall_health
+
+
+# Health checks the automated loop runs through: healthy, a failing account service, recovered
+_CHECKS = (
+    overall_health(),
+    overall_health(account="unhealthy"),
+    overall_health(),
+)
+
+
+class TestMonitoringAutomation:
+    """Test monitoring automation integration."""
+    
+    async def test_monitoring_automation_integration(self, health_checker, health_monitor, reset_monitoring_mocks, caplog):
+        """The background loop records every check, alerts on the unhealthy one and stops cleanly."""
+        health_checker.get_overall_health.side_effect = _CHECKS
+        
+        async def checks_recorded():
+            while len(health_monitor.get_health_history()) < len(_CHECKS):
+                await asyncio.sleep(0)
+        
+        with patch.object(health_monitor, "_monitoring_interval", 0), \
+             caplog.at_level(logging.ERROR, logger="mcp_financial.utils.health"):
+            await health_monitor.start_monitoring()
+            await asyncio.wait_for(checks_recorded(), timeout=5)
+            await health_monitor.stop_monitoring()
+        
+        assert health_monitor.get_health_history() == list(_CHECKS)
+        assert health_monitor._monitoring_task.cancelled()
+        assert not health_monitor.get_health_summary()["monitoring_active"]
+        
+        unhealthy_alerts = [record for record in caplog.records if record.getMessage() == "Service unhealthy alert"]
+        assert [record.service for record in unhealthy_alerts] == ["account-service"]
@@ -0,0 +1,34 @@
+"""
+Monitoring dashboard integration tests.
+"""
+
+from unittest.mock import patch
+
+from mcp_financial.utils.alerting import MonitoringAlerts
+
+from tests.integration.monitoring_helpers import overall_health
+
+
+class TestMonitoringDashboard:
+    """Test monitoring dashboard integration."""
+    
+    async def test_dashboard_integration(
+        self, monitoring_tools, health_checker, health_monitor, alert_manager, reset_monitoring_mocks
+    ):
+        """The monitoring summary combines live health, alert counts and uptime history."""
+        health_checker.get_overall_health.return_value = overall_health(account="unhealthy")
+        health_monitor._health_history.extend([overall_health(), overall_health(account="unhealthy")])
+        await MonitoringAlerts.service_down_alert("account-service", "Service returned 503")
+        
+        get_monitoring_summary = monitoring_tools.get_tool_functions()["get_monitoring_summary"]
+        with patch.object(monitoring_tools, "health_monitor", health_monitor):
+            result = await get_monitoring_summary()
+        
+        summary_text = result[0].text
+        assert "Overall Status: UNHEALTHY" in summary_text
+        assert "account-service: unhealthy" in summary_text
+        assert "transaction-service: healthy" in summary_text
+        assert "Active Alerts: 1" in summary_text
+        assert "By Severity: critical: 1" in summary_text
+        assert "account-service: 50.0%" in summary_text
+        assert "transaction-service: 100.0%" in summary_text
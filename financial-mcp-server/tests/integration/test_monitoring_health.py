@@ -0,0 +1,42 @@
+"""
+Health check monitoring integration tests.
+"""
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+
+class TestMonitoringHealth:
+    """Test health check integration."""
+    
+    @pytest.mark.parametrize("account_code, transaction_code, expected_status, healthy_services", [
+        (200, 200, "HEALTHY", 2),
+        (503, 200, "UNHEALTHY", 1),
+        (503, 503, "UNHEALTHY", 0),
+    ])
+    async def test_health_check_integration(
+        self, monitoring_server, account_code, transaction_code, expected_status, healthy_services
+    ):
+        """The health_check tool reports what the backends' health endpoints answer."""
+        settings = monitoring_server.settings
+        health_checker = monitoring_server.health_checker
+        status_codes = {
+            f"{settings.account_service_url}/actuator/health": account_code,
+            f"{settings.transaction_service_url}/actuator/health": transaction_code,
+        }
+        
+        async def backend_health(url):
+            return httpx.Response(status_codes[url], request=httpx.Request("GET", url))
+        
+        health_check = monitoring_server.monitoring_tools.get_tool_functions()["health_check"]
+        # Start from an empty result cache so every case reaches the backends
+        with patch.dict(health_checker._health_cache, clear=True), \
+             patch.object(health_checker.client, "get", side_effect=backend_health) as backend_get:
+            result = await health_check()
+        
+        assert backend_get.await_count == 2
+        status_text = result[0].text
+        assert status_text.startswith(f"Overall Status: {expected_status}")
+        assert f"Healthy Services: {healthy_services}" in status_text
+        assert "Total Services: 2" in status_text
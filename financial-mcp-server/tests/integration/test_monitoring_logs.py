@@ -0,0 +1,57 @@
+"""
+Log aggregation integration tests.
+"""
+
+import io
+import json
+import logging
+
+from mcp_financial.utils.logging import JSONFormatter, get_logger
+
+
+# Keys every structured log line must carry for aggregation
+REQUIRED_LOG = frozenset({"timestamp", "level", "logger", "message"})
+
+
+class TestMonitoringLogs:
+    """Test log aggregation integration."""
+    
+    def test_log_aggregation_integration(self):
+        """Structured log lines carry the fields and extras the aggregator indexes on."""
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(JSONFormatter())
+        logger = get_logger("mcp_financial.tests.log_aggregation")
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        
+        try:
+            logger.info(
+                "Transaction completed",
+                extra={"user_id": "user_123", "duration_ms": 89, "request_id": "req_792"}
+            )
+            try:
+                raise ConnectionError("Connection timeout")
+            except ConnectionError:
+                logger.exception("Account service connection failed", extra={"request_id": "req_790"})
+        finally:
+            logger.removeHandler(handler)
+        
+        info_log, error_log = (json.loads(line) for line in stream.getvalue().splitlines())
+        
+        # Verify log structure
+        for log in (info_log, error_log):
+            assert REQUIRED_LOG <= log.keys()
+            assert log["logger"] == "mcp_financial.tests.log_aggregation"
+        
+        # Verify request context and timing extras survive formatting
+        assert info_log["level"] == "INFO"
+        assert info_log["message"] == "Transaction completed"
+        assert info_log["user_id"] == "user_123"
+        assert info_log["duration_ms"] == 89
+        assert info_log["request_id"] == "req_792"
+        
+        # Verify error tracking
+        assert error_log["level"] == "ERROR"
+        assert error_log["request_id"] == "req_790"
+        assert "ConnectionError: Connection timeout" in error_log["exception"]
@@ -0,0 +1,40 @@
+"""
+Metrics collection integration tests.
+"""
+
+import pytest
+
+from mcp_financial.utils.metrics import REGISTRY, track_mcp_request
+
+
+def _sample(name, **labels):
+    """Read a sample from the server's metrics registry, treating a missing series as zero."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@track_mcp_request("metrics_probe")
+async def _probe(fail: bool = False):
+    if fail:
+        raise ValueError("probe failed")
+    return "ok"
+
+
+class TestMonitoringMetrics:
+    """Test metrics collection integration."""
+    
+    async def test_metrics_collection_integration(self):
+        """Tracked tool calls are counted, timed and their errors recorded in the registry."""
+        success_before = _sample("mcp_requests_total", tool="metrics_probe", status="success")
+        error_before = _sample("mcp_requests_total", tool="metrics_probe", status="error")
+        duration_before = _sample("mcp_request_duration_seconds_count", tool="metrics_probe")
+        errors_before = _sample("errors_total", error_type="ValueError", component="mcp_tool")
+        
+        assert await _probe() == "ok"
+        assert await _probe() == "ok"
+        with pytest.raises(ValueError):
+            await _probe(fail=True)
+        
+        assert _sample("mcp_requests_total", tool="metrics_probe", status="success") == success_before + 2
+        assert _sample("mcp_requests_total", tool="metrics_probe", status="error") == error_before + 1
+        assert _sample("mcp_request_duration_seconds_count", tool="metrics_probe") == duration_before + 3
+        assert _sample("errors_total", error_type="ValueError", component="mcp_tool") == errors_before + 1
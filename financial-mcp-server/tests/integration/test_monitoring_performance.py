@@ -0,0 +1,29 @@
+"""
+Performance monitoring integration tests.
+"""
+
+import logging
+
+import pytest
+
+from tests.integration.monitoring_helpers import overall_health
+
+
+class TestMonitoringPerformance:
+    """Test performance monitoring integration."""
+    
+    @pytest.mark.parametrize("avg_response_time_ms, alerted", [
+        (120.0, False),
+        (5000.0, False),
+        (6200.0, True),
+    ], ids=["fast", "at-threshold", "slow"])
+    async def test_performance_monitoring_integration(self, health_monitor, caplog, avg_response_time_ms, alerted):
+        """A health check slower than 5s on average raises a high response time alert."""
+        with caplog.at_level(logging.WARNING, logger="mcp_financial.utils.health"):
+            await health_monitor._check_alerts(overall_health(avg_response_time_ms=avg_response_time_ms))
+        
+        alerts = [record for record in caplog.records if record.getMessage() == "High response time alert"]
+        assert len(alerts) == int(alerted)
+        if alerted:
+            assert alerts[0].alert_type == "high_response_time"
+            assert alerts[0].avg_response_time_ms == avg_response_time_ms
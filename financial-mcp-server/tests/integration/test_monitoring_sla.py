@@ -0,0 +1,29 @@
+"""
+SLA monitoring integration tests.
+"""
+
+from tests.integration.monitoring_helpers import overall_health
+
+
+class TestMonitoringSLA:
+    """Test SLA monitoring integration."""
+    
+    def test_sla_monitoring_integration(self, health_monitor):
+        """Uptime per service is the share of recent checks in which it was healthy."""
+        history = [overall_health()] * 3 + [overall_health(account="unhealthy")]
+        health_monitor._health_history.extend(history)
+        
+        uptime = health_monitor.get_health_summary()["uptime_stats"]
+        
+        assert uptime["account-service"] == {"uptime_percentage": 75.0, "total_checks": 4, "healthy_checks": 3}
+        assert uptime["transaction-service"] == {"uptime_percentage": 100.0, "total_checks": 4, "healthy_checks": 4}
+    
+    def test_sla_window_covers_last_twenty_checks(self, health_monitor):
+        """Checks older than the 20-check window no longer count against uptime."""
+        history = [overall_health(account="unhealthy")] * 5 + [overall_health()] * 20
+        health_monitor._health_history.extend(history)
+        
+        uptime = health_monitor.get_health_summary()["uptime_stats"]
+        
+        assert uptime["account-service"]["uptime_percentage"] == 100.0
+        assert uptime["account-service"]["total_checks"] == 20
@@ -4,41 +4,58 @@ Simplified integration tests for monitoring functionality.
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import AsyncMock, patch
 from mcp.server.fastmcp import FastMCP
 
 from mcp_financial.tools.monitoring_tools import MonitoringTools
-from mcp_financial.utils.health import HealthChecker, ServiceStatus, HealthCheckResult
-from mcp_financial.auth.jwt_handler import JWTAuthHandler, UserContext
+from mcp_financial.utils.health import ServiceStatus, HealthCheckResult
+from mcp_financial.auth.jwt_handler import UserContext
 from mcp_financial.utils.alerting import alert_manager, Alert, AlertType, AlertSeverity
 from datetime import datetime
 
+from tests.integration.monitoring_helpers import FakeHealthChecker, FakeJWTAuthHandler, freeze
 
+
+# Payloads the AsyncMock get_overall_health hands back as-is when awaited
+_HEALTHY_RESPONSE = freeze({
+    "status": "healthy",
+    "timestamp": "2023-01-01T00:00:00Z",
+    "services": {
+        "account-service": {
+            "status": "healthy",
+            "response_time_ms": 100.0,
+            "error": None
+        }
+    },
+    "metrics": {
+        "total_services": 1,
+        "healthy_services": 1,
+        "unhealthy_services": 0
+    }
+})
+
+_FULL_INTEGRATION_HEALTH = freeze({
+    "status": "healthy",
+    "services": {"test-service": {"status": "healthy"}},
+    "metrics": {"total_services": 1, "healthy_services": 1}
+})
+
+
+@pytest.mark.xdist_group("monitoring_tools_simple")
+@pytest.mark.usefixtures("reset_monitoring_mocks")
 class TestMonitoringIntegration:
     """Test monitoring integration."""
     
     @pytest.fixture
-    def app(self):
-        return FastMCP("Test MCP Server")
-    
-    @pytest.fixture
-    def health_checker(self):
-        return Mock(spec=HealthChecker)
-    
-    @pytest.fixture
-    def auth_handler(self):
-        handler = Mock(spec=JWTAuthHandler)
-        handler.extract_user_context.return_value = UserContext(
-            user_id="test-user",
-            username="testuser",
-            roles=["admin"],
-            permissions=["read", "write", "admin"]
+    def isolated_alert_manager(self):
+        """Yield the global alert manager and restore its alert and suppression state afterwards."""
+        saved = (
+            dict(alert_manager.active_alerts),
+            list(alert_manager.alert_history),
+            dict(alert_manager.last_alert_times),
         )
-        return handler
-    
-    @pytest.fixture
-    def monitoring_tools(self, app, health_checker, auth_handler):
-        return MonitoringTools(app, health_checker, auth_handler)
+        yield alert_manager
+        alert_manager.active_alerts, alert_manager.alert_history, alert_manager.last_alert_times = saved
     
     def test_monitoring_tools_creation(self, monitoring_tools, health_checker):
         """Test that monitoring tools can be created successfully."""
@@ -51,22 +68,7 @@ class TestMonitoringIntegration:
     async def test_health_checker_integration(self, health_checker):
         """Test health checker functionality."""
         # Mock health checker responses
-        health_checker.get_overall_health.return_value = {
-            "status": "healthy",
-            "timestamp": "2023-01-01T00:00:00Z",
-            "services": {
-                "account-service": {
-                    "status": "healthy",
-                    "response_time_ms": 100.0,
-                    "error": None
-                }
-            },
-            "metrics": {
-                "total_services": 1,
-                "healthy_services": 1,
-                "unhealthy_services": 0
-            }
-        }
+        health_checker.get_overall_health.return_value = _HEALTHY_RESPONSE
         
         result = await health_checker.get_overall_health()
         assert result["status"] == "healthy"
@@ -94,10 +96,10 @@ class TestMonitoringIntegration:
         assert "read" in user_context.permissions
     
     @pytest.mark.asyncio
-    async def test_alert_manager_integration(self):
+    async def test_alert_manager_integration(self, isolated_alert_manager):
         """Test alert manager integration."""
         # Test sending an alert
-        alert_id = await alert_manager.send_alert(
+        alert_id = await isolated_alert_manager.send_alert(
             AlertType.SERVICE_DOWN,
             AlertSeverity.CRITICAL,
             "Integration Test Alert",
@@ -107,12 +109,12 @@ class TestMonitoringIntegration:
         assert alert_id != ""
         
         # Test getting active alerts
-        active_alerts = alert_manager.get_active_alerts()
+        active_alerts = isolated_alert_manager.get_active_alerts()
         assert len(active_alerts) >= 1
         
         # Test resolving alert
         if alert_id:
-            resolved = await alert_manager.resolve_alert(alert_id)
+            resolved = await isolated_alert_manager.resolve_alert(alert_id)
             assert resolved is True
 
 
@@ -122,14 +124,10 @@ async def test_full_monitoring_integration():
     # Create components
     app = FastMCP("Integration Test Server")
     
-    health_checker = Mock(spec=HealthChecker)
-    health_checker.get_overall_health.return_value = {
-        "status": "healthy",
-        "services": {"test-service": {"status": "healthy"}},
-        "metrics": {"total_services": 1, "healthy_services": 1}
-    }
+    health_checker = FakeHealthChecker()
+    health_checker.get_overall_health.return_value = _FULL_INTEGRATION_HEALTH
     
-    auth_handler = Mock(spec=JWTAuthHandler)
+    auth_handler = FakeJWTAuthHandler()
     auth_handler.extract_user_context.return_value = UserContext(
         user_id="integration-test",
         username="testuser",
@@ -5,18 +5,13 @@ Integration tests for HTTP service clients.
 import pytest
 import asyncio
 import httpx
-import sys
-import os
 from unittest.mock import AsyncMock, patch, MagicMock
 from decimal import Decimal
 from datetime import datetime
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from mcp_financial.clients.account_client import AccountServiceClient
 from mcp_financial.clients.transaction_client import TransactionServiceClient
-from mcp_financial.clients.base_client import BaseHTTPClient, CircuitBreakerError, ServiceUnavailableError
+from mcp_financial.clients.base_client import BaseHTTPClient, BreakerState, CircuitBreakerError, ServiceUnavailableError
 
 
 class TestAccountServiceClient:
@@ -401,7 +396,7 @@ class TestBaseHTTPClient:
             
             # After threshold failures, circuit breaker should open
             base_client.circuit_breaker.failure_count = 5
-            base_client.circuit_breaker.state = "OPEN"
+            base_client.circuit_breaker.state = BreakerState.OPEN
             
             with pytest.raises(CircuitBreakerError):
                 await base_client.get("/test")
@@ -0,0 +1,42 @@
+"""
+Integration tests for tool argument validation on the server's call_tool path.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from mcp_financial.protocol import validation
+
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _call_tool(server, name, arguments):
+    """Send a tools/call request through the MCP request handler, as a client would."""
+    handler = server.app._mcp_server.request_handlers[CallToolRequest]
+    request = CallToolRequest(method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments))
+    return (await handler(request)).root
+
+
+class TestToolArgumentValidation:
+    """Tool calls are checked against the tool's compiled input schema."""
+
+    async def test_invalid_arguments_are_rejected_before_the_tool_runs(self, monitoring_server):
+        with patch.object(monitoring_server.account_client, "get_account") as get_account:
+            result = await _call_tool(monitoring_server, "get_account", {})
+
+        assert result.isError
+        assert "'account_id' is a required property" in result.content[0].text
+        get_account.assert_not_called()
+
+    async def test_input_schema_is_compiled_once_per_tool(self, monitoring_server):
+        await _call_tool(monitoring_server, "get_account_balance", {})
+
+        with patch.object(validation, "_compile_validator", wraps=validation._compile_validator) as compile_validator:
+            for _ in range(3):
+                result = await _call_tool(monitoring_server, "get_account_balance", {})
+                assert result.isError
+
+        compile_validator.assert_not_called()
@@ -13,6 +13,7 @@ from typing import List, Dict, Any
 from mcp_financial.server import FinancialMCPServer
 from mcp_financial.clients.account_client import AccountServiceClient
 from mcp_financial.clients.transaction_client import TransactionServiceClient
+from mcp_financial.clients.base_client import BreakerState
 
 
 class TestPerformanceMetrics:
@@ -172,7 +173,7 @@ class TestPerformanceMetrics:
         
         # Test circuit breaker open performance
         async def circuit_breaker_request():
-            with patch.object(performance_server.account_client.circuit_breaker, 'state', 'OPEN'):
+            with patch.object(performance_server.account_client.circuit_breaker, 'state', BreakerState.OPEN):
                 start = time.perf_counter()
                 try:
                     await performance_server.account_client.get_account("acc_123", auth_token)
@@ -92,8 +92,8 @@ class TestJWTAuthHandler:
         assert isinstance(user_context, UserContext)
         assert user_context.user_id == 'user123'
         assert user_context.username == 'testuser'
-        assert user_context.roles == ['customer', 'account_manager']
-        assert user_context.permissions == ['account:read', 'transaction:read']
+        assert user_context.roles == frozenset(['customer', 'account_manager'])
+        assert user_context.permissions == frozenset(['account:read', 'transaction:read'])
     
     def test_extract_user_context_minimal_claims(self, auth_handler):
         """Test user context extraction with minimal claims."""
@@ -108,8 +108,8 @@ class TestJWTAuthHandler:
         
         assert user_context.user_id == 'user456'
         assert user_context.username == ''
-        assert user_context.roles == []
-        assert user_context.permissions == []
+        assert user_context.roles == frozenset([])
+        assert user_context.permissions == frozenset([])
     
     def test_extract_user_context_string_roles(self, auth_handler):
         """Test user context extraction when roles is a string."""
@@ -125,8 +125,8 @@ class TestJWTAuthHandler:
         token = jwt.encode(payload, "test-secret-key", algorithm="HS256")
         user_context = auth_handler.extract_user_context(token)
         
-        assert user_context.roles == ['admin']
-        assert user_context.permissions == ['admin:all']
+        assert user_context.roles == frozenset(['admin'])
+        assert user_context.permissions == frozenset(['admin:all'])
     
     def test_extract_user_context_invalid_token(self, auth_handler):
         """Test user context extraction with invalid token."""
@@ -3,8 +3,11 @@ Unit tests for MCP protocol compliance features.
 """
 
 from types import SimpleNamespace
+from unittest.mock import patch
 
+from mcp_financial.protocol import validation
 from mcp_financial.protocol.compliance import ProtocolCompliance
+from mcp_financial.protocol.validation import ProtocolValidator
 from mcp_financial.protocol.versioning import VersionManager
 
 
@@ -100,3 +103,59 @@ class TestProtocolCompliance:
 
         assert report["overall_status"] == "non_compliant"
         assert report["summary"]["errors"] >= 1
+
+
+class TestProtocolValidator:
+    """Tool argument validation against input schemas."""
+
+    INPUT_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "account_id": {"type": "string"},
+            "amount": {"type": "number"},
+        },
+        "required": ["account_id", "amount"],
+    }
+
+    def setup_method(self):
+        self.validator = ProtocolValidator()
+
+    def test_tool_input_validator_is_compiled_once_per_tool(self):
+        with patch.object(validation, "_compile_validator", wraps=validation._compile_validator) as compile_validator:
+            for _ in range(3):
+                errors = self.validator.validate_tool_arguments(
+                    {"account_id": "acc_123", "amount": 10.0}, self.INPUT_SCHEMA, tool_name="deposit_funds"
+                )
+                assert errors == []
+
+        compile_validator.assert_called_once_with(self.INPUT_SCHEMA)
+
+    def test_tool_input_validator_is_recompiled_when_the_schema_changes(self):
+        changed_schema = {**self.INPUT_SCHEMA, "required": ["account_id"]}
+        with patch.object(validation, "_compile_validator", wraps=validation._compile_validator) as compile_validator:
+            self.validator.validate_tool_arguments({"account_id": "acc_123"}, self.INPUT_SCHEMA, tool_name="deposit_funds")
+            errors = self.validator.validate_tool_arguments(
+                {"account_id": "acc_123"}, changed_schema, tool_name="deposit_funds"
+            )
+
+        assert errors == []
+        assert compile_validator.call_count == 2
+
+    def test_protocol_schema_validators_are_compiled_at_init(self):
+        with patch.object(validation, "_compile_validator", wraps=validation._compile_validator) as compile_validator:
+            errors = self.validator.validate_call_tool_request({"name": "get_account"})
+
+        assert errors == []
+        compile_validator.assert_not_called()
+
+    def test_validate_tool_arguments_happy_path(self):
+        errors = self.validator.validate_tool_arguments(
+            {"account_id": "acc_123", "amount": 10.0}, self.INPUT_SCHEMA
+        )
+
+        assert errors == []
+
+    def test_validate_tool_arguments_reports_missing_required(self):
+        errors = self.validator.validate_tool_arguments({"account_id": "acc_123"}, self.INPUT_SCHEMA)
+
+        assert errors == ["Argument validation error: 'amount' is a required property"]
@@ -10,6 +10,7 @@ from mcp.server.models import InitializationOptions
 
 from mcp_financial.server import FinancialMCPServer
 from mcp_financial.config.settings import Settings
+from mcp_financial.clients.base_client import BreakerState
 
 
 class TestFinancialMCPServer:
@@ -295,7 +296,7 @@ class TestServerIntegration:
                     pass
             
             # Circuit breaker should now be open
-            assert integration_server.account_client.circuit_breaker.state == "OPEN"
+            assert integration_server.account_client.circuit_breaker.state is BreakerState.OPEN
     
     @pytest.mark.asyncio
     async def test_error_propagation(self, integration_server):